@@ -1,6 +1,7 @@
 from spidermon.contrib.stats.analyzer import StatsAnalyzer
 from spidermon.contrib.stats.counters import DictPercentCounter, PercentCounter
 from spidermon.exceptions import NotConfigured
+from spidermon.utils.field_coverage import get_field_coverage
 
 from .job import JobMonitorMixin
 from .stats import StatsMonitorMixin
@@ -116,6 +117,13 @@ class SpiderMonitorMixin(StatsMonitorMixin, JobMonitorMixin):
 
     @property
     def responses(self):
-        if not hasattr(self, "_responses"):
-            self._responses = ResponsesInfo(self.stats)
-        return self._responses
+        return self._get_stats_view("responses", ResponsesInfo)
+
+    @property
+    def field_coverage(self):
+        """
+        Coverage of the scraped item fields, as ``spidermon_field_coverage``
+        stats, computed from the field counts when the stats do not include
+        them yet, for example while the spider is running.
+        """
+        return self._get_stats_view("field_coverage", get_field_coverage)
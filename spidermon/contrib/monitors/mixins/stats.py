@@ -1,3 +1,4 @@
+from spidermon.data import Data
 from spidermon.exceptions import NotConfigured
 
 
@@ -7,3 +8,20 @@ class StatsMonitorMixin:
         if not self.data.stats:
             raise NotConfigured("Stats not available!")
         return self.data.stats
+
+    def _get_stats_view(self, name, factory):
+        """
+        Return ``factory(self.stats)``, built once per stats snapshot and
+        shared by all the monitors of all the suites that read it.
+        """
+        stats = self.stats
+        if isinstance(stats, Data):
+            return stats.get_view(name, factory)
+        # Other mappings are only cached by this monitor, until they change
+        stats_views = self.__dict__.get("_stats_views")
+        if stats_views is None or stats_views[0] is not stats:
+            stats_views = self._stats_views = (stats, {})
+        views = stats_views[1]
+        if name not in views:
+            views[name] = factory(stats)
+        return views[name]
@@ -1,4 +1,6 @@
 import warnings
+from collections import defaultdict
+from collections.abc import Mapping
 
 from spidermon.contrib.scrapy.stats import STATS_DEFAULT_VALIDATION_PREFIX
 from spidermon.contrib.stats.analyzer import StatsAnalyzer
@@ -6,86 +8,380 @@ from spidermon.contrib.stats.counters import (
     AttributeDictPercentCounter,
     DictPercentCounter,
     PercentCounter,
+    PercentCounterBase,
 )
 
 from .stats import StatsMonitorMixin
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+class FieldErrorsMatrix:
+    """
+    Counts of validation errors by field (rows) and error (columns), stored
+    once and shared by :class:`ErrorsInfo` and :class:`FieldErrorsInfo`.
+    Counts are kept in a NumPy array when NumPy is installed.
+    """
+
+    def __init__(self, field_errors=None):
+        # Row of each field and column of each error
+        self.fields = {}
+        self.errors = {}
+        cells = []
+        for error, field_counts in (field_errors or {}).items():
+            if not field_counts:
+                continue
+            column = self.errors.setdefault(error, len(self.errors))
+            for field, count in field_counts:
+                row = self.fields.setdefault(field, len(self.fields))
+                cells.append((row, column, count))
+
+        if np is not None:
+            self._counts = np.zeros(
+                (len(self.fields), len(self.errors)),
+                dtype=np.int64,
+            )
+            if cells:
+                rows, columns, counts = zip(*cells, strict=True)
+                self._counts[rows, columns] = counts
+            self._field_totals = self._counts.sum(axis=1).tolist()
+            self._error_totals = self._counts.sum(axis=0).tolist()
+        else:
+            self._counts = [[0] * len(self.errors) for _ in self.fields]
+            for row, column, count in cells:
+                self._counts[row][column] = count
+            self._field_totals = [sum(row) for row in self._counts]
+            self._error_totals = [
+                sum(column) for column in zip(*self._counts, strict=True)
+            ]
+        self.total = sum(self._error_totals)
+
+    def field_count(self, field):
+        row = self.fields.get(field)
+        return 0 if row is None else self._field_totals[row]
+
+    def error_count(self, error):
+        column = self.errors.get(error)
+        return 0 if column is None else self._error_totals[column]
+
+    def field_errors(self, field):
+        """Return the counts of the errors of ``field``."""
+        row = self.fields.get(field)
+        if row is None:
+            return {}
+        counts = self._counts[row]
+        return {
+            error: int(counts[column])
+            for error, column in self.errors.items()
+            if counts[column]
+        }
+
+    def error_fields(self, error):
+        """Return the counts of ``error`` for each field."""
+        column = self.errors.get(error)
+        if column is None:
+            return {}
+        return {
+            field: int(self._counts[row][column])
+            for field, row in self.fields.items()
+            if self._counts[row][column]
+        }
+
+    def fields_counts(self, errors=None):
+        """Return the count of ``errors``, or of all errors, of every field."""
+        if errors is None:
+            return dict(zip(self.fields, self._field_totals, strict=True))
+        columns = [self.errors[e] for e in errors if e in self.errors]
+        if np is not None:
+            totals = self._counts[:, columns].sum(axis=1).tolist()
+        else:
+            totals = [sum(row[c] for c in columns) for row in self._counts]
+        return dict(zip(self.fields, totals, strict=True))
+
+    def fields_percents(self, total, errors=None):
+        """
+        Return the count of ``errors``, or of all errors, of every field
+        divided by ``total``. With ``errors``, the percents of each error are
+        added up.
+        """
+        if total <= 0:
+            return dict.fromkeys(self.fields, 0)
+        if errors is None:
+            return {
+                field: count / total if count > 0 else 0
+                for field, count in zip(self.fields, self._field_totals, strict=True)
+            }
+        columns = [self.errors[e] for e in errors if e in self.errors]
+        if np is not None:
+            percents = self._counts[:, columns].astype(float) / total
+            percents[percents < 0] = 0
+            totals = percents.sum(axis=1).tolist()
+        else:
+            totals = [
+                sum(max(row[c], 0) / total for c in columns) for row in self._counts
+            ]
+        return dict(zip(self.fields, totals, strict=True))
+
+    def with_value(self, field, error, count):
+        """
+        Return a copy of the matrix with ``count`` more ``error`` errors for
+        ``field``.
+        """
+        field_errors = {
+            error_: list(self.error_fields(error_).items()) for error_ in self.errors
+        }
+        error_counts = dict(field_errors.get(error, []))
+        error_counts[field] = error_counts.get(field, 0) + count
+        field_errors[error] = list(error_counts.items())
+        return FieldErrorsMatrix(field_errors)
+
 
 class MetaDictPercentCounter(DictPercentCounter):
+    """
+    Deprecated, :class:`ErrorsInfo` and :class:`FieldErrorsInfo` are now
+    views of a :class:`FieldErrorsMatrix`.
+    """
+
+    def __init__(self, total):
+        warnings.warn(
+            "MetaDictPercentCounter is deprecated, ErrorsInfo and "
+            "FieldErrorsInfo are now views of a FieldErrorsMatrix",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        super().__init__(total)
+
     def add_values(self, key, subkey, value):
         if key not in self._dict:
             self._create_item(key)
         self[key].add_value(subkey, value)
 
 
+class FieldErrorsLineCounter(PercentCounterBase, Mapping):
+    """Read-only counters of the cells of a row or column of the matrix."""
+
+    __slots__ = ("_counts",)
+
+    def __init__(self, counts, total):
+        super().__init__(total)
+        self._counts = counts
+
+    @property
+    def count(self):
+        return sum(self._counts.values())
+
+    def __getitem__(self, key):
+        return PercentCounter(count=self._counts.get(key, 0), total=self._total)
+
+    def __iter__(self):
+        return iter(self._counts)
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __str__(self):
+        counters = {key: self[key] for key in self}
+        return f"(count={self.count:d}, percent={self.percent:.2f}, {counters!s})"
+
+
 class ErrorsDictPercentCounter(AttributeDictPercentCounter):
+    __slots__ = ()
     __attribute_dict_name__ = "fields"
 
 
-class ErrorsInfo(MetaDictPercentCounter):
+class FieldErrorsDictPercentCounter(AttributeDictPercentCounter):
+    __slots__ = ()
+    __attribute_dict_name__ = "errors"
+
+
+class FieldErrorsMatrixInfo(PercentCounterBase, Mapping):
+    """Read-only counters of the errors or the fields of the matrix."""
+
+    __slots__ = ("matrix",)
+    __items_class__ = AttributeDictPercentCounter
+
+    def __init__(self, total, matrix=None):
+        super().__init__(total)
+        self.matrix = matrix if matrix is not None else FieldErrorsMatrix()
+
+    @property
+    def count(self):
+        return self.matrix.total
+
+    def add_values(self, key, subkey, value):
+        """
+        Add ``value`` to the ``subkey`` counter of ``key``. The matrix is
+        copied first, so other views of it are not changed.
+        """
+        self.matrix = self._with_value(self.matrix, key, subkey, value)
+
+    @staticmethod
+    def _with_value(matrix, key, subkey, value):
+        raise NotImplementedError
+
+    def _get_keys(self):
+        raise NotImplementedError
+
+    def _get_line(self, key):
+        raise NotImplementedError
+
+    def __getitem__(self, key):
+        return self.__items_class__(
+            total=self._total,
+            attribute_dict=FieldErrorsLineCounter(self._get_line(key), self._total),
+        )
+
+    def __iter__(self):
+        return iter(self._get_keys())
+
+    def __len__(self):
+        return len(self._get_keys())
+
+    def __str__(self):
+        counters = {key: self[key] for key in self}
+        return f"(count={self.count:d}, percent={self.percent:.2f}, {counters!s})"
+
+
+class ErrorsInfo(FieldErrorsMatrixInfo):
+    __slots__ = ()
     __items_class__ = ErrorsDictPercentCounter
 
+    def _get_keys(self):
+        return self.matrix.errors
 
-class FieldErrorsDictPercentCounter(AttributeDictPercentCounter):
-    __attribute_dict_name__ = "errors"
+    @staticmethod
+    def _with_value(matrix, key, subkey, value):
+        return matrix.with_value(field=subkey, error=key, count=value)
 
+    def _get_line(self, key):
+        return self.matrix.error_fields(key)
 
-class FieldErrorsInfo(MetaDictPercentCounter):
+
+class FieldErrorsInfo(FieldErrorsMatrixInfo):
+    __slots__ = ("_fields_count",)
     __items_class__ = FieldErrorsDictPercentCounter
 
-    def __init__(self, fields_count, items_count):
-        super().__init__(items_count)
+    def __init__(self, fields_count, items_count, matrix=None):
+        super().__init__(items_count, matrix=matrix)
         self._fields_count = fields_count
 
     @property
     def count(self):
         return self._fields_count
 
+    def _get_keys(self):
+        return self.matrix.fields
+
+    @staticmethod
+    def _with_value(matrix, key, subkey, value):
+        return matrix.with_value(field=key, error=subkey, count=value)
+
+    def _get_line(self, key):
+        return self.matrix.field_errors(key)
+
 
 class ItemsInfo:
-    def __init__(self, items_count, items_with_errors, items_dropped):
+    def __init__(
+        self,
+        items_count,
+        items_with_errors,
+        items_dropped,
+        sampled_count=None,
+    ):
         self.count = items_count
+        self.sampled = items_count if sampled_count is None else sampled_count
         self.errors = PercentCounter(count=items_with_errors, total=items_count)
         self.dropped = PercentCounter(count=items_dropped, total=items_count)
 
 
+class ValidationStatsIndex:
+    """
+    Validation stats indexed by the parts of their names, built in a single
+    pass over the stats.
+    """
+
+    FIELD_ERRORS = ("fields", "errors")
+
+    def __init__(self, stats, prefix):
+        prefix = f"{prefix}/"
+        self.values = {}
+        # Fields with errors and their counts, by error
+        self.field_errors = {}
+        errors = []
+        fields_by_error = defaultdict(list)
+        for key, value in stats.items():
+            if not key.startswith(prefix):
+                continue
+            parts = tuple(key[len(prefix) :].split("/"))
+            self.values[parts] = value
+            if parts[:2] != self.FIELD_ERRORS or not all(parts[2:]):
+                continue
+            if len(parts) == len(self.FIELD_ERRORS) + 1:
+                errors.append(parts[2])
+            elif len(parts) == len(self.FIELD_ERRORS) + 2:
+                fields_by_error[parts[2]].append((parts[3], value))
+        # Only errors with their own stats are listed
+        for error in errors:
+            self.field_errors[error] = fields_by_error[error]
+
+    def get(self, *parts):
+        return self.values.get(parts, 0)
+
+
 class ValidationInfo:
     def __init__(self, stats, prefix=None):
         self.analyzer = StatsAnalyzer(
             stats=stats,
             prefix=prefix or STATS_DEFAULT_VALIDATION_PREFIX,
         )
+        index = ValidationStatsIndex(stats, self.analyzer.prefix)
 
         # items
-        items_count = sum(self.analyzer.search("items$").values())
-        items_with_errors_count = sum(self.analyzer.search("items/errors$").values())
-        items_dropped_count = sum(self.analyzer.search("items/dropped$").values())
+        sampled_count = index.get("items")
+        total_count = index.get("items", "total")
+        # When only a sample of the items is validated, the counts of the
+        # sample are extrapolated to all the items, keeping the percents.
+        if total_count and sampled_count:
+            self.sample_rate = sampled_count / total_count
+            items_count = total_count
+        else:
+            self.sample_rate = 1
+            items_count = sampled_count or total_count
+        items_with_errors_count = index.get("items", "errors")
+        # Only validated items can be dropped, so they are not extrapolated.
+        items_dropped_count = index.get("items", "dropped")
         self.items = ItemsInfo(
             items_count=items_count,
-            items_with_errors=items_with_errors_count,
+            items_with_errors=self._extrapolate(items_with_errors_count),
             items_dropped=items_dropped_count,
+            sampled_count=sampled_count,
         )
 
         # errors & fields
-        fields_count = sum(self.analyzer.search("fields$").values())
-        self.errors = ErrorsInfo(items_count)
+        fields_count = self._extrapolate(index.get("fields"))
+        self.errors_matrix = FieldErrorsMatrix(
+            {
+                error: [
+                    (field, self._extrapolate(sampled_count))
+                    for field, sampled_count in field_errors
+                ]
+                for error, field_errors in index.field_errors.items()
+            },
+        )
+        self.errors = ErrorsInfo(items_count, matrix=self.errors_matrix)
         self.fields = FieldErrorsInfo(
             fields_count=fields_count,
             items_count=items_count,
+            matrix=self.errors_matrix,
         )
 
-        field_errors = self.analyzer.search(
-            "fields/errors/([^/]+)$",
-            include_matches=True,
-        )
-        for _, error in field_errors.values():
-            field_errors_per_field = self.analyzer.search(
-                f"fields/errors/{error}/([^/]+)$",
-                include_matches=True,
-            )
-            for count, field in field_errors_per_field.values():
-                self.errors.add_values(key=error, subkey=field, value=count)
-                self.fields.add_values(key=field, subkey=error, value=count)
+    def _extrapolate(self, count):
+        if self.sample_rate == 1:
+            return count
+        return round(count / self.sample_rate)
 
 
 class ValidationMonitorMixin(StatsMonitorMixin):
@@ -93,9 +389,7 @@ class ValidationMonitorMixin(StatsMonitorMixin):
 
     @property
     def validation(self):
-        if not hasattr(self, "_validation"):
-            self._validation = ValidationInfo(self.stats)
-        return self._validation
+        return self._get_stats_view("validation", ValidationInfo)
 
     def _get_all_fields(self):
         return sorted(self.validation.fields)
@@ -139,12 +433,12 @@ class ValidationMonitorMixin(StatsMonitorMixin):
         if not field_names:
             field_names = self._get_all_fields()
         msgs = []
+        missing_counts = self._get_fields_errors_counts(
+            field_names,
+            ["missing_required_field"],
+        )
         for field_name in field_names:
-            missing_count = (
-                self.validation.fields[field_name]
-                .errors["missing_required_field"]
-                .count
-            )
+            missing_count = missing_counts[field_name]
             if missing_count > allowed_count:
                 msg = self._get_msg_for_missing_required_count(
                     field_name,
@@ -210,12 +504,12 @@ class ValidationMonitorMixin(StatsMonitorMixin):
         if not field_names:
             field_names = self._get_all_fields()
         msgs = []
+        missing_percents = self._get_fields_errors_percents(
+            field_names,
+            ["missing_required_field"],
+        )
         for field_name in field_names:
-            missing_percent = (
-                self.validation.fields[field_name]
-                .errors["missing_required_field"]
-                .percent
-            )
+            missing_percent = missing_percents[field_name]
             if missing_percent > allowed_percent:
                 msg = self._get_msg_for_missing_required_percent(
                     field_name,
@@ -285,8 +579,9 @@ class ValidationMonitorMixin(StatsMonitorMixin):
         if not field_names:
             field_names = self._get_all_fields()
         msgs = []
+        errors_counts = self._get_fields_errors_counts(field_names, errors)
         for field_name in field_names:
-            errors_count = self._get_errors_count(errors, field_name)
+            errors_count = errors_counts[field_name]
             if errors_count > allowed_count:
                 msg = self._get_msg_for_field_errors(
                     field_name,
@@ -314,6 +609,11 @@ class ValidationMonitorMixin(StatsMonitorMixin):
             errors_count = self.validation.fields[field_name].errors.count
         return errors_count
 
+    def _get_fields_errors_counts(self, field_names, errors):
+        # Counts of all the fields are computed at once from the matrix
+        counts = self.validation.errors_matrix.fields_counts(errors or None)
+        return {field_name: counts.get(field_name, 0) for field_name in field_names}
+
     @staticmethod
     def _get_msg_for_field_errors(field_name, errors_count, allowed_count):
         return f"Field {field_name} has {errors_count} validation errors!" + (
@@ -355,8 +655,9 @@ class ValidationMonitorMixin(StatsMonitorMixin):
         if not field_names:
             field_names = self._get_all_fields()
         msgs = []
+        errors_percents = self._get_fields_errors_percents(field_names, errors)
         for field_name in field_names:
-            errors_percent = self._get_errors_percent(errors, field_name)
+            errors_percent = errors_percents[field_name]
             if errors_percent > allowed_percent:
                 msg = self._get_msg_for_field_errors_percent(
                     field_name,
@@ -390,6 +691,13 @@ class ValidationMonitorMixin(StatsMonitorMixin):
             errors_percent = self.validation.fields[field_name].errors.percent
         return errors_percent
 
+    def _get_fields_errors_percents(self, field_names, errors):
+        percents = self.validation.errors_matrix.fields_percents(
+            self.validation.items.count,
+            errors or None,
+        )
+        return {field_name: percents.get(field_name, 0) for field_name in field_names}
+
     @staticmethod
     def _get_msg_for_field_errors_percent(field_name, errors_percent, allowed_percent):
         return "{percent}% of field {field} have validation errors!{threshold_info}".format(
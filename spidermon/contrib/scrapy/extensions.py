@@ -1,16 +1,25 @@
-from itemadapter import ItemAdapter
+import logging
+
 from scrapy import signals
 from scrapy.exceptions import NotConfigured
 from scrapy.utils.misc import load_object
 from twisted.internet.task import LoopingCall
+from twisted.internet.threads import deferToThread
 
 from spidermon import MonitorSuite
 from spidermon.contrib.scrapy.runners import SpiderMonitorRunner
+from spidermon.contrib.scrapy.signals import monitor_suites_starting
 from spidermon.contrib.utils.spider import get_spider_name
+from spidermon.data import Data
 from spidermon.python.monitors import ExpressionsMonitor
-from spidermon.utils.field_coverage import calculate_field_coverage
+from spidermon.utils.field_coverage import (
+    FieldCoverageCounter,
+    calculate_field_coverage,
+)
 from spidermon.utils.zyte import Client
 
+logger = logging.getLogger(__name__)
+
 
 class Spidermon:
     def __init__(  # noqa: PLR0913
@@ -55,6 +64,36 @@ class Spidermon:
 
         self.periodic_suites = periodic_suites or {}
         self.periodic_tasks = {}
+        self.periodic_suites_in_thread = crawler.settings.getbool(
+            "SPIDERMON_PERIODIC_MONITORS_IN_THREAD",
+        )
+        self.monitors_max_workers = crawler.settings.getint(
+            "SPIDERMON_MONITORS_MAX_WORKERS",
+            1,
+        )
+
+        settings = crawler.settings
+        self.field_coverage_flush_interval = settings.getfloat(
+            "SPIDERMON_FIELD_COVERAGE_FLUSH_INTERVAL",
+            0,
+        )
+        self.field_coverage_counter = FieldCoverageCounter(
+            crawler.stats,
+            skip_none_values=settings.getbool(
+                "SPIDERMON_FIELD_COVERAGE_SKIP_NONE",
+                False,
+            ),
+            list_nesting_levels=settings.getint(
+                "SPIDERMON_LIST_FIELDS_COVERAGE_LEVELS",
+                0,
+            ),
+            dict_nesting_levels=settings.getint(
+                "SPIDERMON_DICT_FIELDS_COVERAGE_LEVELS",
+                -1,
+            ),
+            buffered=self.field_coverage_flush_interval > 0,
+        )
+        self._field_coverage_task = None
         self.client = Client(self.crawler.settings)
 
     def load_suite(self, suite_to_load):
@@ -117,18 +156,33 @@ class Spidermon:
 
         if has_field_coverage:
             crawler.signals.connect(ext.item_scraped, signal=signals.item_scraped)
+            crawler.signals.connect(
+                ext.flush_field_coverage,
+                signal=monitor_suites_starting,
+            )
 
         return ext
 
     def spider_opened(self, spider):
+        if self.field_coverage_counter.buffered:
+            self._field_coverage_task = LoopingCall(self.flush_field_coverage)
+            self._field_coverage_task.start(
+                self.field_coverage_flush_interval,
+                now=False,
+            )
         self._run_suites(spider, self.spider_opened_suites)
         self.periodic_tasks[spider] = []
-        for suite, time in self.periodic_suites.items():
+        for suite_to_load, time in self.periodic_suites.items():
+            # Suites are loaded once and run again on every call
+            suite = self.load_suite(suite_to_load)
             task = LoopingCall(self._run_periodic_suites, spider, [suite])
             self.periodic_tasks[spider].append(task)
             task.start(time, now=False)
 
     def spider_closed(self, spider):
+        if self._field_coverage_task is not None and self._field_coverage_task.running:
+            self._field_coverage_task.stop()
+        self.field_coverage_counter.flush()
         self._add_field_coverage_to_stats()
 
         self._run_suites(spider, self.spider_closed_suites)
@@ -139,107 +193,85 @@ class Spidermon:
         spider = self.crawler.spider
         self._run_suites(spider, self.engine_stopped_suites)
 
-    def _count_item(  # noqa: PLR0913
-        self,
-        item,
-        skip_none_values,
-        item_count_stat=None,
-        max_list_nesting_level=0,
-        max_dict_nesting_level=-1,
-        nesting_level=0,
-    ):
-        if item_count_stat is None:
-            item_type = type(item).__name__
-            item_count_stat = f"spidermon_item_scraped_count/{item_type}"
-            self.crawler.stats.inc_value(item_count_stat)
-
-        for field_name, value in ItemAdapter(item).items():
-            if skip_none_values and value is None:
-                continue
-
-            field_item_count_stat = f"{item_count_stat}/{field_name}"
-            self.crawler.stats.inc_value(field_item_count_stat)
-
-            if isinstance(value, dict):
-                # if there's no max (set to -1), we just proceed indefinitely (all levels)
-                # this is for backwards compatibility
-                if max_dict_nesting_level == -1:
-                    self._count_item(value, skip_none_values, field_item_count_stat)
-                    continue
-                if (
-                    max_dict_nesting_level > -1
-                    and nesting_level < max_dict_nesting_level
-                ):
-                    self._count_item(
-                        value,
-                        skip_none_values,
-                        field_item_count_stat,
-                        nesting_level=nesting_level + 1,
-                        max_list_nesting_level=max_list_nesting_level,
-                        max_dict_nesting_level=max_dict_nesting_level,
-                    )
-                    continue
-
-                continue
-
-            if (
-                isinstance(value, list)
-                and max_list_nesting_level > 0
-                and nesting_level < max_list_nesting_level
-            ):
-                items_count_stat = f"{field_item_count_stat}/_items"
-                for list_item in value:
-                    self.crawler.stats.inc_value(items_count_stat)
-                    if isinstance(list_item, dict):
-                        self._count_item(
-                            list_item,
-                            skip_none_values,
-                            items_count_stat,
-                            max_list_nesting_level=max_list_nesting_level,
-                            max_dict_nesting_level=max_dict_nesting_level,
-                            nesting_level=nesting_level + 1,
-                        )
-                        continue
-
     def _add_field_coverage_to_stats(self):
         stats = self.crawler.stats.get_stats()
         coverage_stats = calculate_field_coverage(stats)
         stats.update(coverage_stats)
 
     def item_scraped(self, item, response, spider):
-        skip_none_values = spider.crawler.settings.getbool(
-            "SPIDERMON_FIELD_COVERAGE_SKIP_NONE",
-            False,
-        )
-        list_field_coverage_levels = spider.crawler.settings.getint(
-            "SPIDERMON_LIST_FIELDS_COVERAGE_LEVELS",
-            0,
-        )
-        dict_field_coverage_levels = spider.crawler.settings.getint(
-            "SPIDERMON_DICT_FIELDS_COVERAGE_LEVELS",
-            -1,
-        )
-        self.crawler.stats.inc_value("spidermon_item_scraped_count")
-        self._count_item(
-            item,
-            skip_none_values,
-            max_list_nesting_level=list_field_coverage_levels,
-            max_dict_nesting_level=dict_field_coverage_levels,
-        )
+        self.field_coverage_counter.count(item)
+
+    def flush_field_coverage(self):
+        """
+        Add the field coverage counts buffered when
+        ``SPIDERMON_FIELD_COVERAGE_FLUSH_INTERVAL`` is set to the stats.
+        """
+        self.field_coverage_counter.flush()
 
     def _run_periodic_suites(self, spider, suites):
-        suites = [self.load_suite(s) for s in suites]
-        self._run_suites(spider, suites)
+        if not self.periodic_suites_in_thread:
+            self._run_suites(spider, suites)
+            return None
+
+        self.crawler.signals.send_catch_log(
+            signal=monitor_suites_starting,
+            spider=spider,
+        )
+        # Monitors running in the thread see the stats snapshot taken when
+        # the run started, while the crawl keeps updating the stats
+        data = self._generate_data_for_spider(spider)
+        runners = []
+        for suite in suites:
+            runner = SpiderMonitorRunner(
+                spider=spider,
+                max_workers=self.monitors_max_workers,
+                in_thread=True,
+            )
+            runner.prepare(suite, **data)
+            runners.append(runner)
+        # Only the monitors run in the thread, actions like closing the
+        # spider run in the reactor thread once they have finished.
+        # LoopingCall waits for the returned Deferred, so runs that would
+        # overlap with this one are skipped
+        deferred = deferToThread(self._run_suites_monitors, runners)
+        deferred.addCallback(self._run_suites_actions, runners)
+        deferred.addErrback(self._log_periodic_suites_failure, suites)
+        return deferred
+
+    def _run_suites_monitors(self, runners):
+        for runner in runners:
+            runner.run_suite_monitors()
+
+    def _run_suites_actions(self, _, runners):
+        for runner in runners:
+            runner.run_suite_actions()
+
+    def _log_periodic_suites_failure(self, failure, suites):
+        logger.error(
+            f"Error running periodic monitor suites {suites}",
+            exc_info=(failure.type, failure.value, failure.getTracebackObject()),
+        )
 
     def _run_suites(self, spider, suites):
+        self.crawler.signals.send_catch_log(
+            signal=monitor_suites_starting,
+            spider=spider,
+        )
         data = self._generate_data_for_spider(spider)
+        self._run_suites_with_data(spider, suites, data)
+
+    def _run_suites_with_data(self, spider, suites, data):
         for suite in suites:
-            runner = SpiderMonitorRunner(spider=spider)
+            runner = SpiderMonitorRunner(
+                spider=spider,
+                max_workers=self.monitors_max_workers,
+            )
             runner.run(suite, **data)
 
     def _generate_data_for_spider(self, spider):
         return {
-            "stats": self.crawler.stats.get_stats(),
+            # A single read-only copy of the stats, shared by all the suites
+            "stats": Data(self.crawler.stats.get_stats()),
             "stats_history": spider.stats_history
             if hasattr(spider, "stats_history")
             else [],
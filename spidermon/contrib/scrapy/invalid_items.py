@@ -0,0 +1,104 @@
+import gzip
+import json
+import logging
+import queue
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 1000
+
+# Tells the writer thread that there are no more records
+_CLOSE = object()
+
+
+class InvalidItemsWriter:
+    """
+    Write invalid items and their validation errors as JSON Lines, from a
+    background thread so that file writes and compression do not block the
+    crawl.
+
+    ``path`` may contain ``%(name)s``, replaced by the spider name, and
+    ``%(part)d``, replaced by the number of the file when files are rotated
+    after ``max_file_size`` bytes. Files are gzip-compressed when ``path``
+    ends with ``.gz``. At most ``queue_size`` records wait to be written,
+    further records are discarded until the writer catches up.
+    """
+
+    def __init__(self, path, spider_name="", max_file_size=0, queue_size=None):
+        if max_file_size and "%(part)" not in path:
+            raise ValueError(
+                "The path of invalid items must contain %(part)d when files "
+                "are rotated",
+            )
+        self.path = path
+        self.spider_name = spider_name
+        self.max_file_size = max_file_size
+        self.written = 0
+        self.discarded = 0
+        self._part = 0
+        self._file = None
+        self._raw_file = None
+        self._queue = queue.Queue(maxsize=queue_size or DEFAULT_QUEUE_SIZE)
+        self._thread = threading.Thread(
+            target=self._run,
+            name="spidermon-invalid-items",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def write(self, item, errors):
+        """Queue an invalid item and its errors to be written."""
+        # Items are serialized right away, as they may change afterwards.
+        record = json.dumps({"item": item, "errors": errors}, default=str)
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            if not self.discarded:
+                logger.warning(
+                    "Invalid items are produced faster than they can be "
+                    "written, some of them will not be written",
+                )
+            self.discarded += 1
+
+    def close(self):
+        """Write the queued records and close the current file."""
+        self._queue.put(_CLOSE)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            record = self._queue.get()
+            if record is _CLOSE:
+                break
+            try:
+                self._write_record(record)
+            except Exception:
+                logger.exception("Could not write invalid item")
+        self._close_file()
+
+    def _write_record(self, record):
+        if self._file is None:
+            self._open_file()
+        self._file.write(record.encode("utf-8") + b"\n")
+        self.written += 1
+        if self.max_file_size and self._raw_file.tell() >= self.max_file_size:
+            self._close_file()
+            self._part += 1
+
+    def _open_file(self):
+        path = Path(self.path % {"name": self.spider_name, "part": self._part})
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._raw_file = path.open("wb")
+        if path.suffix == ".gz":
+            self._file = gzip.GzipFile(fileobj=self._raw_file, mode="wb")
+        else:
+            self._file = self._raw_file
+
+    def _close_file(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._raw_file.close()
+        self._file = self._raw_file = None
@@ -360,7 +360,8 @@ class FieldCoverageMonitor(BaseScrapyMonitor):
 
     To use this monitor you need to enable the ``SPIDERMON_ADD_FIELD_COVERAGE``
     setting, which will add information about field coverage to your spider
-    statistics.
+    statistics. When it runs before the spider closes, for example in a
+    periodic suite, the coverage is calculated from the current field counts.
 
     To define your field coverage rules create a dictionary containing the
     expected coverage for each field you want to monitor.
@@ -475,7 +476,7 @@ class FieldCoverageMonitor(BaseScrapyMonitor):
             "SPIDERMON_FIELD_COVERAGE_RULES",
         )
         for field, expected_coverage in field_coverage_rules.items():
-            actual_coverage = self.data.stats.get(
+            actual_coverage = self.field_coverage.get(
                 f"spidermon_field_coverage/{field}",
                 0,
             )
@@ -1,21 +1,77 @@
+import copy
+import logging
+import random
+import zlib
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 
 from itemadapter import ItemAdapter
-from scrapy import Item
+from scrapy import Item, signals
 from scrapy.exceptions import DropItem, NotConfigured
+from scrapy.utils.defer import maybe_deferred_to_future
+from scrapy.utils.misc import load_object
+from twisted.internet.defer import Deferred
+from twisted.internet.task import LoopingCall
+from twisted.python.failure import Failure
 
-from spidermon.contrib.utils.attributes import (
-    get_nested_attribute,
-    set_nested_attribute,
+from spidermon.contrib.utils.attributes import NestedAttribute
+from spidermon.contrib.utils.items import ItemView
+from spidermon.contrib.validation import FastJSONSchemaValidator, JSONSchemaValidator
+from spidermon.contrib.validation.jsonschema.tools import (
+    fetch_schemas,
+    get_schema_from,
+    schemas_registry,
 )
-from spidermon.contrib.validation import JSONSchemaValidator
-from spidermon.contrib.validation.jsonschema.tools import get_schema_from
 
+from .invalid_items import InvalidItemsWriter
+from .signals import monitor_suites_starting
 from .stats import ValidationStatsManager
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_ERRORS_FIELD = "_validation"
 DEFAULT_ADD_ERRORS_TO_ITEM = False
 DEFAULT_DROP_ITEMS_WITH_ERRORS = False
+DEFAULT_VALIDATION_ENGINE = "jsonschema"
+DEFAULT_BATCH_SIZE = 0
+DEFAULT_BATCH_TIMEOUT = 1.0
+DEFAULT_POOL_QUEUE_SIZE = 0
+DEFAULT_POOL_BACKPRESSURE = "wait"
+DEFAULT_SAMPLE_RATE = 1.0
+DEFAULT_STATS_FLUSH_INTERVAL = 0
+
+VALIDATION_ENGINES = {
+    "jsonschema": JSONSchemaValidator,
+    "fastjsonschema": FastJSONSchemaValidator,
+}
+
+VALIDATION_POOLS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+POOL_BACKPRESSURE_MODES = ("wait", "inline")
+
+# Validators of the item types, set once in each worker process of the
+# validation process pool.
+_worker_validators = None
+
+
+def _init_validation_worker(validators):
+    global _worker_validators  # noqa: PLW0603
+    _worker_validators = validators
+
+
+def _run_validators(validators, item_dict):
+    # Validators keep the errors of the last validation in the instance, so
+    # a shallow copy is used to validate items concurrently without sharing
+    # that state.
+    return [copy.copy(validator).validate(item_dict) for validator in validators]
+
+
+def _run_worker_validators(key, item_dict):
+    return _run_validators(_worker_validators[key], item_dict)
 
 
 class PassThroughPipeline:
@@ -24,21 +80,66 @@ class PassThroughPipeline:
 
 
 class ItemValidationPipeline:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         validators,
         stats,
         drop_items_with_errors=DEFAULT_DROP_ITEMS_WITH_ERRORS,
         add_errors_to_items=DEFAULT_ADD_ERRORS_TO_ITEM,
         errors_field=None,
+        batch_size=DEFAULT_BATCH_SIZE,
+        batch_timeout=DEFAULT_BATCH_TIMEOUT,
+        pool=None,
+        pool_size=None,
+        pool_queue_size=DEFAULT_POOL_QUEUE_SIZE,
+        pool_backpressure=DEFAULT_POOL_BACKPRESSURE,
+        sample_rate=DEFAULT_SAMPLE_RATE,
+        sample_key=None,
+        stats_flush_interval=DEFAULT_STATS_FLUSH_INTERVAL,
+        invalid_items_path=None,
+        invalid_items_max_size=0,
+        invalid_items_queue_size=None,
     ):
         self.drop_items_with_errors = drop_items_with_errors
         self.add_errors_to_items = add_errors_to_items or DEFAULT_ADD_ERRORS_TO_ITEM
         self.errors_field = errors_field or DEFAULT_ERRORS_FIELD
+        self._errors_field_attribute = NestedAttribute(self.errors_field)
         self.validators = validators
-        self.stats = ValidationStatsManager(stats)
+        self.stats_flush_interval = stats_flush_interval or DEFAULT_STATS_FLUSH_INTERVAL
+        self.stats = ValidationStatsManager(
+            stats,
+            buffered=self.stats_flush_interval > 0,
+        )
+        self._stats_task = None
+        self.invalid_items_path = invalid_items_path
+        self.invalid_items_max_size = invalid_items_max_size
+        self.invalid_items_queue_size = invalid_items_queue_size
+        if invalid_items_max_size and "%(part)" not in (invalid_items_path or ""):
+            raise NotConfigured(
+                "SPIDERMON_VALIDATION_INVALID_ITEMS_PATH must contain %(part)d "
+                "when SPIDERMON_VALIDATION_INVALID_ITEMS_MAX_SIZE is set",
+            )
+        self._invalid_items = None
         for _type, vals in validators.items():
-            [self.stats.add_validator(_type, val.name) for val in vals]
+            type_name = getattr(_type, "__name__", _type)
+            [self.stats.add_validator(type_name, val.name) for val in vals]
+        self._class_validators = {}
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+        self.batch_timeout = batch_timeout or DEFAULT_BATCH_TIMEOUT
+        self._batch = []
+        self._batch_task = None
+        self.pool_queue_size = pool_queue_size or DEFAULT_POOL_QUEUE_SIZE
+        self.pool_backpressure = pool_backpressure or DEFAULT_POOL_BACKPRESSURE
+        self._pool = self._create_pool(pool, pool_size)
+        self._pool_pending = 0
+        self._pool_waiters = []
+        if not 0 < sample_rate <= 1:
+            raise NotConfigured(
+                f"Invalid <{sample_rate}> value for <SPIDERMON_VALIDATION_SAMPLE_RATE> "
+                "setting, a number greater than 0 and less than or equal to 1 is required",
+            )
+        self.sample_rate = sample_rate
+        self.sample_key = sample_key
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -52,16 +153,34 @@ class ItemValidationPipeline:
         def set_validators(loader, schema):
             if type(schema) in (list, tuple):
                 schema = {Item: schema}
+            paths_by_type = {}
             for obj, paths_value in schema.items():
-                key = obj.__name__
-                paths = (
+                paths_by_type[obj] = (
                     paths_value if type(paths_value) in (list, tuple) else [paths_value]
                 )
+            # Fetch all the schemas from URLs at once before loading them
+            fetch_schemas(
+                [path for paths in paths_by_type.values() for path in paths],
+                cache_dir=cache_dir,
+            )
+            for obj, paths in paths_by_type.items():
                 objects = [loader(v) for v in paths]
-                validators[key].extend(objects)
+                validators[obj].extend(objects)
+
+        engine = cls._get_validation_engine(
+            crawler.settings.get("SPIDERMON_VALIDATION_ENGINE"),
+        )
+        cache_dir = crawler.settings.get("SPIDERMON_VALIDATION_SCHEMAS_CACHE_DIR")
 
         for loader, name in [
-            (cls._load_jsonschema_validator, "SPIDERMON_VALIDATION_SCHEMAS"),
+            (
+                partial(
+                    cls._load_jsonschema_validator,
+                    validator_cls=engine,
+                    cache_dir=cache_dir,
+                ),
+                "SPIDERMON_VALIDATION_SCHEMAS",
+            ),
         ]:
             res = crawler.settings.get(name)
             if not res:
@@ -76,7 +195,7 @@ class ItemValidationPipeline:
         if not validators:
             raise NotConfigured("No validators were found")
 
-        return cls(
+        pipeline = cls(
             validators=validators,
             stats=crawler.stats,
             drop_items_with_errors=crawler.settings.getbool(
@@ -86,12 +205,96 @@ class ItemValidationPipeline:
                 "SPIDERMON_VALIDATION_ADD_ERRORS_TO_ITEMS",
             ),
             errors_field=crawler.settings.get("SPIDERMON_VALIDATION_ERRORS_FIELD"),
+            batch_size=crawler.settings.getint("SPIDERMON_VALIDATION_BATCH_SIZE"),
+            batch_timeout=crawler.settings.getfloat(
+                "SPIDERMON_VALIDATION_BATCH_TIMEOUT",
+            ),
+            pool=crawler.settings.get("SPIDERMON_VALIDATION_POOL"),
+            pool_size=crawler.settings.getint("SPIDERMON_VALIDATION_POOL_SIZE"),
+            pool_queue_size=crawler.settings.getint(
+                "SPIDERMON_VALIDATION_POOL_QUEUE_SIZE",
+            ),
+            pool_backpressure=crawler.settings.get(
+                "SPIDERMON_VALIDATION_POOL_BACKPRESSURE",
+            ),
+            sample_rate=crawler.settings.getfloat(
+                "SPIDERMON_VALIDATION_SAMPLE_RATE",
+                DEFAULT_SAMPLE_RATE,
+            ),
+            sample_key=crawler.settings.get("SPIDERMON_VALIDATION_SAMPLE_KEY"),
+            stats_flush_interval=crawler.settings.getfloat(
+                "SPIDERMON_VALIDATION_STATS_FLUSH_INTERVAL",
+            ),
+            invalid_items_path=crawler.settings.get(
+                "SPIDERMON_VALIDATION_INVALID_ITEMS_PATH",
+            ),
+            invalid_items_max_size=crawler.settings.getint(
+                "SPIDERMON_VALIDATION_INVALID_ITEMS_MAX_SIZE",
+            ),
+            invalid_items_queue_size=crawler.settings.getint(
+                "SPIDERMON_VALIDATION_INVALID_ITEMS_QUEUE_SIZE",
+            ),
         )
+        # Monitors must see all the validation stats when they run
+        crawler.signals.connect(
+            pipeline.flush_stats,
+            signal=monitor_suites_starting,
+        )
+        crawler.signals.connect(pipeline.flush_stats, signal=signals.spider_closed)
+        return pipeline
+
+    def _create_pool(self, pool, pool_size):
+        if not pool:
+            return None
+        if pool not in VALIDATION_POOLS:
+            raise NotConfigured(
+                f"Invalid <{pool}> value for <SPIDERMON_VALIDATION_POOL> setting, "
+                f"one of {', '.join(VALIDATION_POOLS)} is required",
+            )
+        if self.pool_backpressure not in POOL_BACKPRESSURE_MODES:
+            raise NotConfigured(
+                f"Invalid <{self.pool_backpressure}> value for "
+                "<SPIDERMON_VALIDATION_POOL_BACKPRESSURE> setting, one of "
+                f"{', '.join(POOL_BACKPRESSURE_MODES)} is required",
+            )
+        if self.batch_size > 1:
+            raise NotConfigured(
+                "SPIDERMON_VALIDATION_POOL and SPIDERMON_VALIDATION_BATCH_SIZE "
+                "cannot be used together",
+            )
+        if pool == "process":
+            # Validators are sent once to each worker process, which then
+            # only receives the index of the validators to use for each item.
+            validators = list(self.validators.values())
+            self._validators_keys = {id(vals): i for i, vals in enumerate(validators)}
+            return ProcessPoolExecutor(
+                max_workers=pool_size or None,
+                initializer=_init_validation_worker,
+                initargs=(validators,),
+            )
+        return ThreadPoolExecutor(max_workers=pool_size or None)
 
     @classmethod
-    def _load_jsonschema_validator(cls, schema):
+    def _get_validation_engine(cls, engine):
+        engine = engine or DEFAULT_VALIDATION_ENGINE
+        if isinstance(engine, str):
+            engine = VALIDATION_ENGINES.get(engine) or load_object(engine)
+        if not (isinstance(engine, type) and issubclass(engine, JSONSchemaValidator)):
+            raise NotConfigured(
+                f"Invalid <{engine}> value for <SPIDERMON_VALIDATION_ENGINE> "
+                "setting, a JSONSchemaValidator subclass is required",
+            )
+        return engine
+
+    @classmethod
+    def _load_jsonschema_validator(
+        cls,
+        schema,
+        validator_cls=JSONSchemaValidator,
+        cache_dir=None,
+    ):
         if isinstance(schema, str):
-            schema = get_schema_from(schema)
+            schema = get_schema_from(schema, cache_dir=cache_dir)
         if not isinstance(schema, dict):
             raise NotConfigured(
                 "Invalid schema, jsonschemas must be defined as:\n"
@@ -100,7 +303,53 @@ class ItemValidationPipeline:
                 "- an object path to a JSON string.\n"
                 "- a path to a JSON file.",
             )
-        return JSONSchemaValidator(schema)
+        try:
+            return validator_cls(schema, registry=schemas_registry)
+        except ImportError as e:
+            raise NotConfigured(str(e)) from e
+
+    def open_spider(self, spider=None):
+        if self.batch_size > 1:
+            self._batch_task = LoopingCall(self._flush_batch)
+            self._batch_task.start(self.batch_timeout, now=False)
+        if self.stats_flush_interval > 0:
+            self._stats_task = LoopingCall(self.flush_stats)
+            self._stats_task.start(self.stats_flush_interval, now=False)
+        if self.invalid_items_path:
+            self._invalid_items = InvalidItemsWriter(
+                self.invalid_items_path,
+                spider_name=getattr(spider, "name", ""),
+                max_file_size=self.invalid_items_max_size,
+                queue_size=self.invalid_items_queue_size,
+            )
+
+    def close_spider(self, spider=None):
+        if self._batch_task is not None and self._batch_task.running:
+            self._batch_task.stop()
+        self._flush_batch()
+        if self._pool is not None:
+            self._pool.shutdown()
+        if self._stats_task is not None and self._stats_task.running:
+            self._stats_task.stop()
+        self.flush_stats()
+        if self._invalid_items is not None:
+            self._close_invalid_items()
+
+    def _close_invalid_items(self):
+        writer, self._invalid_items = self._invalid_items, None
+        writer.close()
+        if writer.discarded:
+            logger.warning(
+                f"{writer.discarded} invalid items could not be written to "
+                f"{self.invalid_items_path}",
+            )
+
+    def flush_stats(self):
+        """
+        Add the validation stats buffered when
+        ``SPIDERMON_VALIDATION_STATS_FLUSH_INTERVAL`` is set to the stats.
+        """
+        self.stats.flush()
 
     def process_item(self, item, _):
         validators = self.find_validators(item)
@@ -108,28 +357,213 @@ class ItemValidationPipeline:
             # No validators match this specific item type
             return item
 
+        if self.sample_rate < 1:
+            self.stats.add_total_item()
+            if not self._is_sampled(item):
+                return item
+
+        if self.batch_size > 1:
+            return self._add_to_batch(item, validators)
+
         item_adapter = ItemAdapter(item)
-        item_dict = item_adapter.asdict()
+        item_dict = self._get_item_data(item, item_adapter, validators)
         self.stats.add_item()
         self.stats.add_fields(len(item_dict.keys()))
-        for validator in validators:
-            ok, errors = validator.validate(item_dict)
-            if not ok:
-                self._add_error_stats(errors)
-                if self.add_errors_to_items:
-                    self._add_errors_to_item(item_adapter, errors)
-                if self.drop_items_with_errors:
-                    self._drop_item(item, errors)
+        if self._pool is not None:
+            return self._validate_item_in_pool(
+                item, item_adapter, item_dict, validators
+            )
+        return self._validate_item(item, item_adapter, item_dict, validators)
+
+    def _is_sampled(self, item):
+        """
+        Return whether the item should be validated. When a sample key is
+        set, the decision is based on a hash of its value, so the same items
+        are always sampled across jobs.
+        """
+        if self.sample_key:
+            value = ItemAdapter(item).get(self.sample_key)
+            if value is not None:
+                sample = zlib.crc32(str(value).encode()) / 2**32
+                return sample < self.sample_rate
+        return random.random() < self.sample_rate  # noqa: S311
+
+    def _get_item_data(self, item, item_adapter, validators):
+        """
+        Return the data of the item to validate. Validators that accept any
+        mapping get a read-only view of the item instead of a copy of it.
+        """
+        if isinstance(self._pool, ProcessPoolExecutor) or not all(
+            getattr(validator, "accepts_mappings", False) for validator in validators
+        ):
+            return item_adapter.asdict()
+        return ItemView(item if isinstance(item, dict) else item_adapter)
+
+    async def _add_to_batch(self, item, validators):
+        deferred = Deferred()
+        self._batch.append((item, validators, deferred))
+        if len(self._batch) >= self.batch_size:
+            self._flush_batch()
+        return await maybe_deferred_to_future(deferred)
+
+    def _flush_batch(self):
+        """
+        Validate all the buffered items, updating the item and field counters
+        once for the whole batch, and fire the result of each item.
+
+        Errors are sent to the result of the items they happen with, so that
+        every item gets a result and the flush never raises.
+        """
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        adapted = []
+        for item, validators, deferred in batch:
+            try:
+                item_adapter = ItemAdapter(item)
+                item_dict = self._get_item_data(item, item_adapter, validators)
+                fields_count = len(item_dict.keys())
+            except Exception:  # noqa: PERF203
+                deferred.errback()
+            else:
+                adapted.append(
+                    (item, item_adapter, item_dict, validators, deferred, fields_count),
+                )
+        try:
+            self.stats.add_item(count=len(adapted))
+            self.stats.add_fields(sum(a[5] for a in adapted))
+        except Exception:
+            failure = Failure()
+            for *_, deferred, _ in adapted:
+                deferred.errback(failure)
+            return
+
+        for item, item_adapter, item_dict, validators, deferred, _ in adapted:
+            try:
+                result = self._validate_item(item, item_adapter, item_dict, validators)
+            except Exception:  # noqa: PERF203
+                deferred.errback()
+            else:
+                deferred.callback(result)
+
+    async def _validate_item_in_pool(self, item, item_adapter, item_dict, validators):
+        if self.pool_queue_size and self._pool_pending >= self.pool_queue_size:
+            if self.pool_backpressure == "inline":
+                return self._validate_item(item, item_adapter, item_dict, validators)
+            # Wait for a running validation to hand over its slot.
+            waiter = Deferred()
+            self._pool_waiters.append(waiter)
+            await maybe_deferred_to_future(waiter)
+        else:
+            self._pool_pending += 1
+
+        try:
+            results = await maybe_deferred_to_future(
+                self._submit_to_pool(validators, item_dict),
+            )
+        finally:
+            if self._pool_waiters:
+                self._pool_waiters.pop(0).callback(None)
+            else:
+                self._pool_pending -= 1
+
+        self._handle_validation_results(item, item_adapter, results)
+        return item
+
+    def _submit_to_pool(self, validators, item_dict):
+        """
+        Run the validators in the pool, returning a Deferred fired in the
+        reactor thread with their results.
+        """
+        from twisted.internet import reactor  # noqa: PLC0415
+
+        if isinstance(self._pool, ProcessPoolExecutor):
+            future = self._pool.submit(
+                _run_worker_validators,
+                self._validators_keys[id(validators)],
+                item_dict,
+            )
+        else:
+            future = self._pool.submit(_run_validators, validators, item_dict)
+
+        deferred = Deferred()
+
+        def fire(future):
+            exception = future.exception()
+            if exception is not None:
+                deferred.errback(Failure(exception))
+            else:
+                deferred.callback(future.result())
+
+        future.add_done_callback(lambda f: reactor.callFromThread(fire, f))
+        return deferred
+
+    def _validate_item(self, item, item_adapter, item_dict, validators):
+        # Validators run lazily, so none runs after the item is dropped
+        results = (validator.validate(item_dict) for validator in validators)
+        self._handle_validation_results(item, item_adapter, results)
         return item
 
+    def _handle_validation_results(self, item, item_adapter, results):
+        """
+        Handle the result of each validator of the item, and write the item
+        once with the errors of all the validators if it is invalid.
+        """
+        if self._invalid_items is None:
+            for ok, errors in results:
+                self._handle_validation_result(item, item_adapter, ok, errors)
+            return
+
+        invalid_item = None
+        invalid_item_errors = defaultdict(list)
+        try:
+            for ok, errors in results:
+                if not ok:
+                    if invalid_item is None:
+                        # Taken before errors are added to the item, and
+                        # serialized before later pipelines can change it
+                        invalid_item = item_adapter.asdict()
+                    for field_name, messages in errors.items():
+                        invalid_item_errors[field_name] += messages
+                self._handle_validation_result(item, item_adapter, ok, errors)
+        finally:
+            if invalid_item is not None:
+                self._invalid_items.write(invalid_item, dict(invalid_item_errors))
+
+    def _handle_validation_result(self, item, item_adapter, ok, errors):
+        if not ok:
+            self._add_error_stats(errors)
+            if self.add_errors_to_items:
+                self._add_errors_to_item(item_adapter, errors)
+            if self.drop_items_with_errors:
+                self._drop_item(item, errors)
+
     def find_validators(self, item):
-        def find(x):
-            return self.validators.get(x.__name__, [])
+        item_class = item.__class__
+        try:
+            return self._class_validators[item_class]
+        except KeyError:
+            validators = self._find_class_validators(item_class)
+            self._class_validators[item_class] = validators
+            return validators
 
-        return find(item.__class__) or find(Item)
+    def _find_class_validators(self, item_class):
+        """
+        Return the validators of the closest class in the MRO of the item
+        class that has validators, falling back to the validators of
+        ``scrapy.Item`` for items of any other type.
+        """
+        for cls in (*item_class.__mro__, Item):
+            # Validators keyed by class name are still supported when the
+            # pipeline is created directly.
+            validators = self.validators.get(cls) or self.validators.get(cls.__name__)
+            if validators:
+                return validators
+        return []
 
     def _add_errors_to_item(self, item: ItemAdapter, errors: dict[str, str]):
-        errors_field_instance = get_nested_attribute(item, self.errors_field)
+        errors_field_instance = self._errors_field_attribute.get(item)
 
         if errors_field_instance is None:
             errors_field_instance = defaultdict(list)
@@ -138,7 +572,7 @@ class ItemValidationPipeline:
             errors_field_instance[field_name] += messages
 
         # change defaultdict to dict for errors_field_instance
-        set_nested_attribute(item, self.errors_field, dict(errors_field_instance))
+        self._errors_field_attribute.set(item, dict(errors_field_instance))
 
     def _drop_item(self, item, errors):
         """
@@ -1,5 +1,7 @@
 import logging
 
+from twisted.python.threadable import isInIOThread
+
 from spidermon.results.monitor import (
     MonitorResult,
     actions_step_required,
@@ -12,9 +14,11 @@ LOG_MESSAGE_HEADER = "Spidermon"
 
 
 class SpiderMonitorResult(MonitorResult):
-    def __init__(self, spider):
+    def __init__(self, spider, in_thread=False):
         super().__init__()
         self.spider = spider
+        # Set when the monitors run in a thread while the reactor is running
+        self.in_thread = in_thread
 
     def next_step(self):
         super().next_step()
@@ -116,13 +120,21 @@ class SpiderMonitorResult(MonitorResult):
         self.log(msg, level=logging.INFO)
 
     def log(self, msg, level=logging.DEBUG):
-        self.spider.log(f"[{LOG_MESSAGE_HEADER}] {msg}", level=level)
+        msg = f"[{LOG_MESSAGE_HEADER}] {msg}"
+        if not self.in_thread or isInIOThread():
+            self.spider.log(msg, level=level)
+            return
+        # Monitors running in a thread log from the reactor thread, in order
+        from twisted.internet import reactor  # noqa: PLC0415
+
+        reactor.callFromThread(self.spider.log, msg, level=level)
 
 
 class SpiderMonitorRunner(MonitorRunner):
-    def __init__(self, spider):
-        super().__init__()
+    def __init__(self, spider, max_workers=None, in_thread=False):
+        super().__init__(max_workers=max_workers)
         self.spider = spider
+        self.in_thread = in_thread
 
     def create_result(self):
-        return SpiderMonitorResult(self.spider)
+        return SpiderMonitorResult(self.spider, in_thread=self.in_thread)
@@ -0,0 +1,3 @@
+# Sent by the Spidermon extension right before running monitor suites, so
+# that components buffering stats can write them to the stats collector.
+monitor_suites_starting = object()
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from slugify import slugify
 
 STATS_DEFAULT_VALIDATION_PREFIX = "spidermon/validation"
@@ -5,6 +7,7 @@ STATS_DEFAULT_VALIDATION_PREFIX = "spidermon/validation"
 
 class NAMES:
     ITEMS = "items"
+    TOTAL = "total"
     DROPPED = "dropped"
     FIELDS = "fields"
     ERRORS = "errors"
@@ -12,10 +15,18 @@ class NAMES:
 
 
 class ValidationStatsManager:
-    def __init__(self, stats, prefix=None, slugify=True):
+    # Maximum number of stats names kept in each cache of stats names
+    names_cache_size = 10000
+
+    def __init__(self, stats, prefix=None, slugify=True, buffered=False):
         self.stats = stats
         self.prefix = prefix or STATS_DEFAULT_VALIDATION_PREFIX
         self.slugify = slugify
+        # When buffered, counters are increased locally and only added to the
+        # stats when flushed.
+        self._buffer = Counter() if buffered else None
+        self._names_cache = {}
+        self._field_errors_names_cache = {}
 
     def add_validator(self, type, class_name):  # noqa: A002
         self.stats.inc_value(self._get_stats_name(NAMES.VALIDATORS))
@@ -25,26 +36,63 @@ class ValidationStatsManager:
         )
 
     def add_field_error(self, field, error):
-        self.stats.inc_value(self._get_stats_name(NAMES.FIELDS, NAMES.ERRORS))
-        self.stats.inc_value(self._get_stats_name(NAMES.FIELDS, NAMES.ERRORS, error))
-        self.stats.inc_value(
-            self._get_stats_name(NAMES.FIELDS, NAMES.ERRORS, error) + "/" + field,
-        )
+        self._inc_value(self._get_stats_name(NAMES.FIELDS, NAMES.ERRORS))
+        error_name = self._get_stats_name(NAMES.FIELDS, NAMES.ERRORS, error)
+        self._inc_value(error_name)
+        self._inc_value(self._get_field_error_stats_name(error_name, field))
 
     def add_fields(self, count):
-        self.stats.inc_value(self._get_stats_name(NAMES.FIELDS), count=count)
+        self._inc_value(self._get_stats_name(NAMES.FIELDS), count=count)
+
+    def add_item(self, count=1):
+        self._inc_value(self._get_stats_name(NAMES.ITEMS), count=count)
 
-    def add_item(self):
-        self.stats.inc_value(self._get_stats_name(NAMES.ITEMS))
+    def add_total_item(self, count=1):
+        self._inc_value(self._get_stats_name(NAMES.ITEMS, NAMES.TOTAL), count=count)
 
     def add_dropped_item(self):
-        self.stats.inc_value(self._get_stats_name(NAMES.ITEMS, NAMES.DROPPED))
+        self._inc_value(self._get_stats_name(NAMES.ITEMS, NAMES.DROPPED))
 
     def add_item_with_errors(self):
-        self.stats.inc_value(self._get_stats_name(NAMES.ITEMS, NAMES.ERRORS))
+        self._inc_value(self._get_stats_name(NAMES.ITEMS, NAMES.ERRORS))
+
+    def flush(self):
+        """Add the buffered counters to the stats."""
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, Counter()
+        for name, count in buffer.items():
+            self.stats.inc_value(name, count=count)
+
+    def _inc_value(self, name, count=1):
+        if self._buffer is None:
+            self.stats.inc_value(name, count=count)
+        else:
+            self._buffer[name] += count
 
     def _get_stats_name(self, *names):
-        return "/".join([self.prefix, *map(self._get_name, names)])
+        # The same few names are built for every item and error, so they are
+        # cached instead of slugifying their parts every time.
+        try:
+            return self._names_cache[names]
+        except KeyError:
+            name = "/".join([self.prefix, *map(self._get_name, names)])
+            self._cache_name(self._names_cache, names, name)
+            return name
+
+    def _get_field_error_stats_name(self, error_name, field):
+        key = (error_name, field)
+        try:
+            return self._field_errors_names_cache[key]
+        except KeyError:
+            # Field names are not slugified
+            name = f"{error_name}/{field}"
+            self._cache_name(self._field_errors_names_cache, key, name)
+            return name
+
+    def _cache_name(self, cache, key, name):
+        if len(cache) < self.names_cache_size:
+            cache[key] = name
 
     def _get_name(self, name):
         return slugify(text=name, separator="_").lower() if self.slugify else name
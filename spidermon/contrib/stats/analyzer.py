@@ -1,17 +1,27 @@
 import re
+from bisect import bisect_left
+from functools import lru_cache
+
+from spidermon.data import Data
+
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+REGEX_QUANTIFIERS = frozenset("*+?{")
 
 
 class StatsAnalyzer:
     def __init__(self, stats, prefix=None):
         self.stats = stats
         self.prefix = prefix or ""
+        self._index = None
+        self._indexed_keys = None
 
     def search(self, pattern, include_matches=False):
-        pattern = re.compile(self._get_pattern(pattern))
+        pattern, literal_prefix = _compile(self._get_pattern(pattern))
         results = {}
-        for key, count in self.stats.items():
+        for key in self._get_candidate_keys(literal_prefix):
             match = pattern.match(key)
             if match:
+                count = self.stats[key]
                 if include_matches:
                     results[key] = (
                         count,
@@ -25,3 +35,80 @@ class StatsAnalyzer:
         if self.prefix:
             return f"{self.prefix}/{pattern}"
         return pattern
+
+    def _get_candidate_keys(self, literal_prefix):
+        """
+        Return the keys that start with ``literal_prefix``, in the order of
+        the stats, using an index of the keys sorted alphabetically.
+        """
+        if not literal_prefix:
+            return list(self.stats)
+        # The index is built on the first search. Stats that are not Data may
+        # change, so it is built again if stats were added, removed or
+        # reordered since then.
+        if isinstance(self.stats, Data):
+            if self._index is None:
+                self._index = sorted((key, i) for i, key in enumerate(self.stats))
+        else:
+            keys = tuple(self.stats)
+            if self._index is None or self._indexed_keys != keys:
+                self._index = sorted((key, i) for i, key in enumerate(keys))
+                self._indexed_keys = keys
+        candidates = []
+        for i in range(bisect_left(self._index, (literal_prefix,)), len(self._index)):
+            key, position = self._index[i]
+            if not key.startswith(literal_prefix):
+                break
+            candidates.append((position, key))
+        return [key for _, key in sorted(candidates)]
+
+
+@lru_cache(maxsize=512)
+def _compile(pattern):
+    return re.compile(pattern), _get_literal_prefix(pattern)
+
+
+def _get_literal_prefix(pattern):
+    """
+    Return the text that all the strings matched from the start by the
+    regular expression ``pattern`` start with.
+    """
+    if _has_top_level_alternation(pattern):
+        return ""
+    prefix = []
+    for char in pattern:
+        if char in REGEX_METACHARACTERS:
+            # A quantifier makes the previous character optional
+            if char in REGEX_QUANTIFIERS and prefix:
+                prefix.pop()
+            break
+        prefix.append(char)
+    return "".join(prefix)
+
+
+def _has_top_level_alternation(pattern):
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # "]" is a literal when it is the first character of a class
+            if pattern[i + 1 : i + 2] == "^":
+                i += 1
+            if pattern[i + 1 : i + 2] == "]":
+                i += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        i += 1
+    return False
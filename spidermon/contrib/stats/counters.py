@@ -2,6 +2,8 @@ import collections
 
 
 class PercentCounterBase:
+    __slots__ = ("_total",)
+
     def __init__(self, total=0):
         self._total = total
 
@@ -23,6 +25,8 @@ class PercentCounterBase:
 
 
 class PercentCounter(PercentCounterBase):
+    __slots__ = ("_count",)
+
     def __init__(self, count=0, total=0):
         super().__init__(total)
         self._count = count
@@ -36,20 +40,24 @@ class PercentCounter(PercentCounterBase):
 
 
 class DictPercentCounter(PercentCounterBase, collections.abc.MutableMapping):
+    __slots__ = ("_count", "_dict")
     __items_class__: type[PercentCounterBase] = PercentCounter
 
     def __init__(self, total):
         super().__init__(total)
         self._dict = {}
+        # Running total of the values added to the items
+        self._count = 0
 
     @property
     def count(self):
-        return sum([e.count for e in self._dict.values()])
+        return self._count
 
     def add_value(self, key, value):
         if key not in self._dict:
             self._create_item(key)
         self[key].inc_value(value)
+        self._count += value
 
     def _create_item(self, key):
         self._dict[key] = self.__items_class__(total=self._total)
@@ -79,19 +87,30 @@ class DictPercentCounter(PercentCounterBase, collections.abc.MutableMapping):
 
 
 class AttributeDictPercentCounter(PercentCounterBase):
+    __slots__ = ("_attribute_dict",)
     __attribute_dict_name__ = "dict"
 
-    def __init__(self, total):
+    def __init__(self, total, attribute_dict=None):
         super().__init__(total)
-        setattr(self, self.__attribute_dict_name__, DictPercentCounter(total))
+        self._attribute_dict = (
+            DictPercentCounter(total) if attribute_dict is None else attribute_dict
+        )
+
+    def __getattr__(self, name):
+        # The dict is available as the __attribute_dict_name__ attribute
+        if name == self.__attribute_dict_name__:
+            return self._attribute_dict
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}",
+        )
 
     @property
     def attribute_dict(self):
-        return getattr(self, self.__attribute_dict_name__)
+        return self._attribute_dict
 
     @property
     def count(self):
-        return sum([e.count for e in self.attribute_dict.values()])
+        return self._attribute_dict.count
 
     def add_value(self, key, value):
         self.attribute_dict.add_value(key, value)
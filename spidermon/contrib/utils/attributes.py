@@ -10,10 +10,9 @@ def traverse_nested(obj: ItemAdapter, keys: list[str]) -> ItemAdapter:
         KeyError: if any of the keys in the path is not defined.
     """
     current_obj = obj
-    while keys:
+    for key in keys:
         try:
             # Traverse next level of item object
-            key = keys.pop(0)
             current_obj = ItemAdapter(current_obj[key])
         # KeyError: Key does not exist
         # TypeError: Key is not compatible with ItemAdapter (None or unsupported type)
@@ -49,3 +48,59 @@ def set_nested_attribute(item: ItemAdapter, attribute_path: str, value: Any):
         nested_obj = ItemAdapter(nested_obj)
 
     nested_obj[last_key] = value
+
+
+class NestedAttribute:
+    """
+    Accessor of a nested attribute of items, given as a path of keys
+    separated by dots. The path is parsed once, so that the attribute can be
+    read and written in many items.
+    """
+
+    __slots__ = ("_keys", "_last_key", "path")
+
+    def __init__(self, attribute_path: str):
+        self.path = attribute_path
+        *keys, self._last_key = attribute_path.split(".")
+        self._keys = tuple(keys)
+
+    def get(self, item):
+        """
+        Get the value of the attribute in ``item``, an ItemAdapter or any
+        object supported by it.
+
+        Raises:
+            KeyError: if any of the keys in the path is not defined.
+        """
+        return self._traverse(item).get(self._last_key)
+
+    def set(self, item, value: Any):
+        """
+        Set the value of the attribute in ``item``, an ItemAdapter or any
+        object supported by it.
+
+        Raises:
+            KeyError:  if any of the keys in the path is not defined or
+                if the last key in the path is not supported by its parent field.
+        """
+        self._traverse(item)[self._last_key] = value
+
+    def _traverse(self, item):
+        # Dicts are used directly instead of wrapping them in an ItemAdapter
+        if isinstance(item, ItemAdapter) and type(item.item) is dict:
+            item = item.item
+        elif not isinstance(item, (dict, ItemAdapter)):
+            item = ItemAdapter(item)
+        current_obj = item
+        for key in self._keys:
+            try:
+                current_obj = current_obj[key]
+                if type(current_obj) is not dict:
+                    current_obj = ItemAdapter(current_obj)
+            # KeyError: Key does not exist
+            # TypeError: Key is not compatible with ItemAdapter (None or unsupported type)
+            except (KeyError, TypeError) as err:  # noqa: PERF203
+                raise KeyError(
+                    f'Invalid key "{key}" for {current_obj} in {item}',
+                ) from err
+        return current_obj
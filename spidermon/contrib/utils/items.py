@@ -0,0 +1,52 @@
+from collections.abc import Mapping
+
+from itemadapter import ItemAdapter
+
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class ItemView(Mapping):
+    """
+    Read-only mapping over an item and its nested items, lists and dicts,
+    with the same content as ``ItemAdapter(item).asdict()``, but without
+    copying the item. Nested values are wrapped when they are accessed.
+    """
+
+    __slots__ = ("_mapping",)
+
+    def __init__(self, item):
+        self._mapping = (
+            item if isinstance(item, (dict, ItemAdapter)) else ItemAdapter(item)
+        )
+
+    def __getitem__(self, key):
+        return get_view(self._mapping[key])
+
+    def __iter__(self):
+        return iter(self._mapping)
+
+    def __len__(self):
+        return len(self._mapping)
+
+    def __contains__(self, key):
+        return key in self._mapping
+
+    def __repr__(self):
+        return repr({key: self[key] for key in self})
+
+
+def get_view(value):
+    """Return a read-only view of a value of an item, see :class:`ItemView`."""
+    if isinstance(value, (*SCALAR_TYPES, ItemView)):
+        return value
+    if isinstance(value, dict) or ItemAdapter.is_item(value):
+        return ItemView(value)
+    if isinstance(value, (list, tuple)):
+        if all(isinstance(v, SCALAR_TYPES) for v in value):
+            return value
+        views = (get_view(v) for v in value)
+        # Named tuples take their values as separate arguments
+        if hasattr(value, "_fields"):
+            return type(value)(*views)
+        return type(value)(views)
+    return value
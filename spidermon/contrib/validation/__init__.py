@@ -1,3 +1,3 @@
-from .jsonschema.validator import JSONSchemaValidator
+from .jsonschema.validator import FastJSONSchemaValidator, JSONSchemaValidator
 
-__all__ = ["JSONSchemaValidator"]
+__all__ = ["FastJSONSchemaValidator", "JSONSchemaValidator"]
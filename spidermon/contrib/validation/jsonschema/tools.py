@@ -1,32 +1,101 @@
+import copy
+import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Any
+from urllib.error import HTTPError
 from urllib.parse import urlparse
-from urllib.request import urlopen
+from urllib.request import Request, urlopen
 
+from referencing import Registry, Resource
+from referencing.exceptions import NoSuchResource
+from referencing.jsonschema import DRAFT202012
 from scrapy.utils.misc import load_object
 
 logger = logging.getLogger(__name__)
 
+MAX_FETCH_WORKERS = 8
 
-def get_schema_from(source):
+# Schemas loaded from URLs and JSON files, shared by all the crawlers of the
+# process. File schemas are stored with the modification time of the file,
+# so that they are loaded again when the file changes.
+_schemas_cache: dict[str, Any] = {}
+
+
+def get_schema_from(source, cache_dir=None):
+    """
+    Return the schema defined by ``source``: a URL, a path to a JSON file, or
+    the object path of a dict or a JSON string.
+
+    Schemas from URLs and JSON files are only fetched and parsed once per
+    process. When ``cache_dir`` is set, URL schemas are also stored in that
+    directory and only fetched again when they change.
+    """
     if is_schema_url(source):
-        schema = get_contents(source)
-        try:
-            return json.loads(schema)
-        except Exception as e:
-            logger.exception(str(e) + f"\nCould not parse schema from '{source}'")
+        schema = _get_url_schema(source, cache_dir=cache_dir)
     elif source.endswith(".json"):
-        with Path(source).open() as f:
-            try:
-                return json.load(f)
-            except Exception as e:
-                logger.exception(str(e) + f"\nCould not parse schema in '{source}'")
+        schema = _get_file_schema(source)
     else:
         schema = load_object(source)
         if isinstance(schema, str):
             return json.loads(schema)
         return schema
+    # Callers get their own copy, so that changing it does not change the
+    # schema of other crawlers.
+    return copy.deepcopy(schema)
+
+
+def fetch_schemas(sources, cache_dir=None):
+    """
+    Fetch the schemas of ``sources`` that are URLs concurrently, so that
+    :func:`get_schema_from` later gets them from the cache.
+    """
+    urls = {
+        source
+        for source in sources
+        if isinstance(source, str)
+        and is_schema_url(source)
+        and source not in _schemas_cache
+    }
+    if len(urls) < 2:  # noqa: PLR2004
+        return
+    with ThreadPoolExecutor(max_workers=min(len(urls), MAX_FETCH_WORKERS)) as pool:
+        list(pool.map(partial(_get_url_schema, cache_dir=cache_dir), urls))
+
+
+def clear_schemas_cache():
+    _schemas_cache.clear()
+
+
+def _get_url_schema(url, cache_dir=None):
+    if url in _schemas_cache:
+        return _schemas_cache[url]
+    contents = get_cached_contents(url, cache_dir) if cache_dir else get_contents(url)
+    try:
+        schema = json.loads(contents)
+    except Exception as e:
+        logger.exception(str(e) + f"\nCould not parse schema from '{url}'")
+        return None
+    _schemas_cache[url] = schema
+    return schema
+
+
+def _get_file_schema(path):
+    mtime = Path(path).stat().st_mtime_ns
+    cached = _schemas_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with Path(path).open() as f:
+        try:
+            schema = json.load(f)
+        except Exception as e:
+            logger.exception(str(e) + f"\nCould not parse schema in '{path}'")
+            return None
+    _schemas_cache[path] = (mtime, schema)
+    return schema
 
 
 def is_schema_url(path):
@@ -43,3 +112,78 @@ def get_contents(url):
             return f.read().decode("utf-8")
     except Exception as e:
         logger.exception(str(e) + f"\nFailed to get '{url}'")
+
+
+def get_cached_contents(url, cache_dir):
+    """
+    Return the contents of ``url``, stored in ``cache_dir`` with its ETag and
+    Last-Modified headers, which are used to only download it again when it
+    has changed.
+    """
+    cache_path = Path(cache_dir) / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+    try:
+        cached = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        cached = None
+
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        with urlopen(Request(url, headers=headers)) as f:  # noqa: S310
+            contents = f.read().decode("utf-8")
+            etag = f.headers.get("ETag")
+            last_modified = f.headers.get("Last-Modified")
+    except HTTPError as e:
+        if cached and e.code == 304:  # noqa: PLR2004
+            return cached["contents"]
+        return _get_stale_contents(url, cached, e)
+    except Exception as e:
+        return _get_stale_contents(url, cached, e)
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "contents": contents,
+                },
+            ),
+        )
+    except OSError as e:
+        logger.warning(f"Could not cache '{url}' in '{cache_dir}': {e}")
+    return contents
+
+
+def _get_stale_contents(url, cached, error):
+    if not cached:
+        logger.error(f"{error}\nFailed to get '{url}'")
+        return None
+    logger.warning(f"Failed to get '{url}' ({error}), using the cached copy")
+    return cached["contents"]
+
+
+def retrieve_schema(uri):
+    """
+    Retrieve the document of a ``$ref`` to another schema, reusing the
+    schemas already loaded by :func:`get_schema_from`.
+    """
+    if not (is_schema_url(uri) or uri.endswith(".json")):
+        raise NoSuchResource(ref=uri)
+    schema = get_schema_from(uri)
+    if schema is None:
+        raise NoSuchResource(ref=uri)
+    return Resource.from_contents(schema, default_specification=DRAFT202012)
+
+
+# Registry used to resolve references to other schemas, shared by all the
+# validators created from SPIDERMON_VALIDATION_SCHEMAS.
+# mypy does not see the ``retrieve`` alias of the private attrs field
+schemas_registry = Registry(retrieve=retrieve_schema)  # type: ignore[call-arg]
@@ -3,6 +3,44 @@ from typing import ClassVar
 from spidermon.contrib.validation import messages
 from spidermon.contrib.validation.translator import MessageTranslator
 
+TYPE_MESSAGES = {
+    "array": messages.INVALID_ARRAY,
+    "boolean": messages.INVALID_BOOLEAN,
+    "integer": messages.INVALID_INT,
+    "number": messages.INVALID_NUMBER,
+    "object": messages.INVALID_OBJECT,
+    "string": messages.INVALID_STRING,
+    "null": messages.NOT_NULL,
+}
+
+FORMAT_MESSAGES = {
+    "date-time": messages.INVALID_DATETIME,
+    "email": messages.INVALID_EMAIL,
+    "ipv4": messages.INVALID_IPV4,
+    "ipv6": messages.INVALID_IPV6,
+    "hostname": messages.INVALID_HOSTNAME,
+    "url": messages.INVALID_URL,
+    "uri": messages.INVALID_URI,
+    "regex": messages.INVALID_REGEX,
+    "color": messages.INVALID_COLOR,
+}
+
+KEYWORD_MESSAGES = {
+    "required": messages.MISSING_REQUIRED_FIELD,
+    "enum": messages.VALUE_NOT_IN_CHOICES,
+    "anyOf": messages.NOT_VALID_UNDER_ANY_SCHEMA,
+    "dependencies": messages.MISSING_DEPENDENT_FIELD,
+    "dependentRequired": messages.MISSING_DEPENDENT_FIELD,
+    "minimum": messages.NUMBER_TOO_LOW,
+    "exclusiveMinimum": messages.NUMBER_TOO_LOW,
+    "maximum": messages.NUMBER_TOO_HIGH,
+    "exclusiveMaximum": messages.NUMBER_TOO_HIGH,
+    "multipleOf": messages.NOT_MULTIPLE_OF,
+    "not": messages.NOT_ALLOWED_VALUE,
+    "pattern": messages.REGEX_NOT_MATCHED,
+    "uniqueItems": messages.NOT_UNIQUE,
+}
+
 
 class JSONSchemaMessageTranslator(MessageTranslator):
     messages: ClassVar[dict[str, str]] = {
@@ -44,3 +82,43 @@ class JSONSchemaMessageTranslator(MessageTranslator):
         r"^.+ does not match .*$": messages.REGEX_NOT_MATCHED,
         r"^.+ has non-unique elements$": messages.NOT_UNIQUE,
     }
+
+    def translate_error(self, error):
+        """
+        Translate a jsonschema `ValidationError` using the keyword that
+        failed and its value, instead of parsing the error message.
+
+        Errors of keywords with no known message, and all errors when the
+        translator messages are customized, are translated from their
+        message text.
+        """
+        message = None
+        if self.messages is JSONSchemaMessageTranslator.messages:
+            message = self._get_keyword_message(error.validator, error.validator_value)
+        if message is None:
+            message = self.translate_message(error.message)
+        return message
+
+    def _get_keyword_message(self, keyword, value):  # noqa: PLR0911
+        if keyword == "type":
+            types = value if isinstance(value, list) else [value]
+            # Like the message patterns, use the last type listed
+            if types and isinstance(types[-1], str):
+                return TYPE_MESSAGES.get(types[-1])
+            return None
+        if keyword == "format":
+            return FORMAT_MESSAGES.get(value) if isinstance(value, str) else None
+        if keyword in ("minLength", "minItems", "minProperties"):
+            if value == 1:
+                return messages.SHOULD_BE_NON_EMPTY
+            if keyword == "minProperties":
+                return messages.NOT_ENOUGH_PROPERTIES
+            return messages.FIELD_TOO_SHORT
+        if keyword in ("maxLength", "maxItems", "maxProperties"):
+            if value == 0:
+                # "is expected to be empty" has no translation
+                return None
+            if keyword == "maxProperties":
+                return messages.TOO_MANY_PROPERTIES
+            return messages.FIELD_TOO_LONG
+        return KEYWORD_MESSAGES.get(keyword)
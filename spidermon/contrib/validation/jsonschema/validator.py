@@ -1,35 +1,262 @@
+import logging
 import re
+from collections.abc import Mapping
+from urllib.parse import urldefrag, urljoin
 
-from jsonschema.validators import validator_for
+from jsonschema.validators import extend, validator_for
+from referencing.exceptions import (
+    CannotDetermineSpecification,
+    NoSuchResource,
+    Unretrievable,
+)
 
 from spidermon.contrib.validation.validator import Validator
 
-from .formats import format_checker
+from .formats import format_checker, is_email, is_url
 from .translator import JSONSchemaMessageTranslator
 
-REQUIRED_RE = re.compile("'(.+)' is a required property")
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+logger = logging.getLogger(__name__)
+
+# Drafts supported by fastjsonschema, which must be set explicitly
+FASTJSONSCHEMA_DRAFT_RE = re.compile(
+    r"^https?://json-schema\.org/draft-0[467]/schema#?$"
+)
+
+
+def _is_fastjsonschema_draft(schema):
+    return isinstance(schema, dict) and bool(
+        FASTJSONSCHEMA_DRAFT_RE.match(str(schema.get("$schema", ""))),
+    )
+
+
+def _with_referenced_schemas(registry, schema):
+    """
+    Return ``registry`` with the schemas referenced by ``schema``, and by the
+    schemas that those reference in turn, retrieved.
+    """
+    pending = [(schema.get("$id", ""), schema)]
+    while pending:
+        base_uri, contents = pending.pop()
+        for ref in _iter_refs(contents):
+            uri, _ = urldefrag(urljoin(base_uri, ref))
+            if not uri or uri in registry:
+                continue
+            try:
+                retrieved = registry.get_or_retrieve(uri)
+            except (NoSuchResource, Unretrievable, CannotDetermineSpecification):
+                # Left for jsonschema to report when the reference is used
+                continue
+            registry = retrieved.registry
+            pending.append((uri, retrieved.value.contents))
+    return registry
+
+
+def _iter_refs(contents):
+    if isinstance(contents, dict):
+        for key, value in contents.items():
+            if key == "$ref" and isinstance(value, str):
+                yield value
+            else:
+                yield from _iter_refs(value)
+    elif isinstance(contents, list):
+        for value in contents:
+            yield from _iter_refs(value)
 
 
 class JSONSchemaValidator(Validator):
     default_translator = JSONSchemaMessageTranslator()
     name = "JSONSchema"
+    # Whether any mapping, and not only dicts, can be validated as an object
+    accepts_mappings = True
 
-    def __init__(self, schema, translator=None, use_default_translator=True):
+    def __init__(
+        self,
+        schema,
+        translator=None,
+        use_default_translator=True,
+        registry=None,
+    ):
         super().__init__(
             translator=translator,
             use_default_translator=use_default_translator,
         )
         self._schema = schema
+        # Registry used to resolve references to other schemas
+        self._schemas_registry = registry
+        self._compile()
 
-    def _validate(self, data, strict=False):
+    def _compile(self):
+        # The registry is immutable, so the referenced schemas are added to
+        # it here, once, instead of being retrieved on every validation.
+        self._registry = (
+            None
+            if self._schemas_registry is None
+            else _with_referenced_schemas(self._schemas_registry, self._schema)
+        )
+        # Building the jsonschema validator (resolving the draft, wiring the
+        # format checker) is expensive, so it is done once per schema instead
+        # of once per validated item.
         validator_cls = validator_for(self._schema)
-        validator = validator_cls(schema=self._schema, format_checker=format_checker)
-        errors = validator.iter_errors(data)
+        validator_cls = extend(
+            validator_cls,
+            type_checker=validator_cls.TYPE_CHECKER.redefine(
+                "object",
+                lambda _, instance: isinstance(instance, Mapping),
+            ),
+        )
+        kwargs = {} if self._registry is None else {"registry": self._registry}
+        self._validator = validator_cls(
+            schema=self._schema,
+            format_checker=format_checker,
+            **kwargs,
+        )
+
+    def __getstate__(self):
+        # Compiled validators are rebuilt from the schema when unpickled, so
+        # that instances can be sent to worker processes.
+        state = self.__dict__.copy()
+        state.pop("_validator", None)
+        # Retrieved resources cannot be pickled
+        state.pop("_registry", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile()
+
+    @property
+    def errors(self):
+        if not self._translates_errors:
+            return super().errors
+        # Messages were already translated when the errors were added
+        return dict(self._errors)
+
+    @property
+    def _translates_errors(self):
+        return hasattr(self._translator, "translate_error")
+
+    def _validate(self, data, strict=False):
+        errors = self._validator.iter_errors(data)
+        translate = self._translates_errors
+        missing_fields = {}
 
         for error in errors:
             absolute_path = list(error.absolute_path)
-            required_match = REQUIRED_RE.search(error.message)
-            if required_match:
-                absolute_path.append(required_match.group(1))
+            if error.validator == "required":
+                field = self._get_missing_field(error, missing_fields)
+                if field is not None:
+                    absolute_path.append(field)
             field_name = ".".join([str(p) for p in absolute_path])
-            self._add_errors({field_name: [error.message]})
+            message = (
+                self._translator.translate_error(error) if translate else error.message
+            )
+            self._add_errors({field_name: [message]})
+
+    def _get_missing_field(self, error, missing_fields):
+        """
+        Return the name of the missing field of a `required` error.
+
+        jsonschema yields one error per missing field, in the order of the
+        `required` list, so the missing fields of each `required` keyword
+        are computed once and assigned to its errors in turn.
+        """
+        if not isinstance(error.validator_value, list):
+            # Draft 3 `required` errors already include the field in the path
+            return None
+        key = (tuple(error.absolute_path), tuple(error.absolute_schema_path))
+        if key not in missing_fields:
+            missing_fields[key] = iter(
+                [
+                    field
+                    for field in error.validator_value
+                    if field not in error.instance
+                ],
+            )
+        return next(missing_fields[key], None)
+
+
+class FastJSONSchemaValidator(JSONSchemaValidator):
+    """
+    JSON Schema validator that first checks data with a schema compiled by
+    `fastjsonschema`, and only runs the regular jsonschema validation to
+    collect the error details of data that fails that check.
+
+    Format checks are performed by each library on its own, so there may be
+    small differences with :class:`JSONSchemaValidator` for formats that
+    only one of them supports. If the schema does not set draft 4, 6 or 7 in
+    ``$schema``, or cannot be compiled, every item is validated with
+    jsonschema.
+    """
+
+    # The compiled schema only accepts dicts as objects
+    accepts_mappings = False
+
+    def __init__(
+        self,
+        schema,
+        translator=None,
+        use_default_translator=True,
+        registry=None,
+    ):
+        if fastjsonschema is None:
+            raise ImportError(
+                "fastjsonschema is required to use the fastjsonschema "
+                "validation engine",
+            )
+        super().__init__(
+            schema,
+            translator=translator,
+            use_default_translator=use_default_translator,
+            registry=registry,
+        )
+
+    def _compile(self):
+        super()._compile()
+        if not _is_fastjsonschema_draft(self._schema):
+            # fastjsonschema defaults to draft 7 while jsonschema defaults to
+            # the latest draft, so they would not accept the same items
+            logger.warning(
+                "fastjsonschema only supports schemas that set draft 4, 6 or 7 "
+                "in $schema, falling back to jsonschema",
+            )
+            self._compiled = None
+            return
+        handlers = {}
+        if self._registry is not None:
+            handlers = dict.fromkeys(("http", "https"), self._retrieve_reference)
+        try:
+            self._compiled = fastjsonschema.compile(
+                self._schema,
+                handlers=handlers,
+                formats={"email": is_email, "url": is_url},
+                use_default=False,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Could not compile schema with fastjsonschema ({e}), "
+                "falling back to jsonschema",
+            )
+            self._compiled = None
+
+    def _retrieve_reference(self, uri):
+        return self._registry.get_or_retrieve(uri).value.contents
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop("_compiled", None)
+        return state
+
+    def _validate(self, data, strict=False):
+        if self._compiled is not None:
+            try:
+                self._compiled(data)
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+            else:
+                return
+        super()._validate(data, strict=strict)
@@ -1,20 +1,81 @@
 import re
+from functools import lru_cache
 from typing import ClassVar
 
+# Patterns using backreferences can't be merged into a single regular
+# expression, as group numbers and names change when they are combined.
+BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+NAMED_GROUP_RE = re.compile(r"\(\?P<[^>]+>")
+
 
 class MessageTranslator:
     messages: ClassVar[dict[str, str]] = {}
+    cache_size = 4096
 
     def __init__(self):
         self.compiled_messages = {m: re.compile(m) for m in self.messages}
+        self._combined_pattern = self._combine_patterns(list(self.messages))
+        self._create_cache()
+
+    def _create_cache(self):
+        # Validation errors repeat a lot across items, so translations are
+        # cached by the original message.
+        self._translate_message = lru_cache(maxsize=self.cache_size)(
+            self._translate_uncached_message,
+        )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_translate_message"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._create_cache()
 
     def translate_messages(self, messages):
         return [self.translate_message(m) for m in messages]
 
     def translate_message(self, message):
-        for target_message, pattern in self.compiled_messages.items():
-            pattern_found = pattern.search(message)
+        return self._translate_message(message)
+
+    def _translate_uncached_message(self, message):
+        if self._combined_pattern is not None:
+            target_messages = self._find_combined_match(message)
+        else:
+            target_messages = self.compiled_messages
+        for target_message in target_messages:
+            pattern_found = self.compiled_messages[target_message].search(message)
             if pattern_found:
                 groups = pattern_found.groupdict()
                 return self.messages[target_message].format(**groups)
         return message
+
+    def _find_combined_match(self, message):
+        match = self._combined_pattern.match(message)
+        if not match:
+            return []
+        return [self._patterns_by_group[match.lastgroup]]
+
+    def _combine_patterns(self, patterns):
+        """
+        Merge all the patterns into a single alternation, so that finding
+        the first one that matches a message takes one regex call instead
+        of one per pattern.
+
+        Each pattern is prefixed with a lazy match of any text, so that
+        matching the combined expression at the start of the message finds
+        the first pattern that `search` would find, as the original
+        patterns are tried in order.
+        """
+        if not patterns or any(BACKREFERENCE_RE.search(p) for p in patterns):
+            return None
+        self._patterns_by_group = {f"_m{i}": p for i, p in enumerate(patterns)}
+        alternatives = [
+            f"(?P<{group}>(?s:.*?)(?:{NAMED_GROUP_RE.sub('(?:', pattern)}))"
+            for group, pattern in self._patterns_by_group.items()
+        ]
+        try:
+            return re.compile("|".join(alternatives))
+        except re.error:
+            return None
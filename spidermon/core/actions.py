@@ -45,6 +45,16 @@ class Action(metaclass=ActionOptionsMetaclass):
             result.add_action_success(self)
         data.meta.update(self.get_meta())
 
+    def reset(self):
+        """
+        Clear the state kept from a previous run. Override it to reset any
+        state that an action keeps between the runs of a reused suite.
+        """
+        self.result = None
+        self.data = None
+        if self.fallback is not None:
+            self.fallback.reset()
+
     @abc.abstractmethod
     def run_action(self):
         raise NotImplementedError
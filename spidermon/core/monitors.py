@@ -97,6 +97,15 @@ class Monitor(TestCase, metaclass=MonitorOptionsMetaclass):
     def init_data(self, data):
         self.data = data
 
+    def reset(self):
+        """
+        Clear the state kept from a previous run. Override it to reset any
+        state that a monitor keeps between the runs of a reused suite.
+        """
+        self.data = None
+        # Views cached by the stats mixins for the stats of the last run
+        self.__dict__.pop("_stats_views", None)
+
     def debug_tree(self, level=0):
         return level * "\t" + repr(self) + "\n"
 
@@ -25,6 +25,9 @@ class MonitorSuite(TestSuite, metaclass=MonitorOptionsMetaclass):
     monitors_passed_actions: ClassVar[list[str]] = []
     monitors_failed_actions: ClassVar[list[str]] = []
 
+    # Keep the monitors after running them, so that suites can be run again
+    _cleanup = False
+
     def __init__(  # noqa: PLR0913
         self,
         name=None,
@@ -129,6 +132,20 @@ class MonitorSuite(TestSuite, metaclass=MonitorOptionsMetaclass):
         for test in self:
             test.init_data(data)
 
+    def reset(self):
+        """
+        Clear the state kept from a previous run of the suite, its monitors
+        and its actions. Called by runners before each run.
+        """
+        for test in self:
+            test.reset()
+        for action in (
+            *self.monitors_finished_actions,
+            *self.monitors_passed_actions,
+            *self.monitors_failed_actions,
+        ):
+            action.reset()
+
     def add_monitors(self, monitors):
         if not isinstance(monitors, collections.abc.Iterable):
             raise InvalidMonitorIterable("Monitors definition is not iterable")
@@ -18,6 +18,18 @@ class Data(dict):
             return self[name]
         raise AttributeError(f"Key '{name}' not found.")
 
+    def get_view(self, name, factory):
+        """
+        Return ``factory(self)``, built the first time ``name`` is requested
+        and shared by everyone reading this data afterwards.
+        """
+        # Stored outside of the dict items, bypassing __setattr__
+        views = self.__dict__.setdefault("_views", {})
+        if name not in views:
+            # Monitors running concurrently get the first view built
+            views.setdefault(name, factory(self))
+        return views[name]
+
     def _immutable(self, *args, **kws):
         raise InvalidDataOperation(
             "Immutable Data! You cannot add or modify read-only data.",
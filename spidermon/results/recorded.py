@@ -0,0 +1,61 @@
+import unittest
+
+
+class RecordedResult(unittest.TestResult):
+    """
+    Result that records the calls made by a monitor running in another
+    thread, to replay them later on the result of the runner from a single
+    thread, in the order of the monitors.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def replay(self, result):
+        for method_name, args in self.calls:
+            getattr(result, method_name)(*args)
+
+    def startTest(self, test):
+        self.calls.append(("startTest", (test,)))
+
+    def stopTest(self, test):
+        self.calls.append(("stopTest", (test,)))
+
+    def addSuccess(self, test):
+        self.calls.append(("addSuccess", (test,)))
+
+    def stop(self):
+        super().stop()
+        self.calls.append(("stop", ()))
+
+    def addError(self, test, err):
+        self.calls.append(("addError", (test, err)))
+        self._stop_on_failure()
+
+    def addFailure(self, test, err):
+        self.calls.append(("addFailure", (test, err)))
+        self._stop_on_failure()
+
+    def addSkip(self, test, reason):
+        self.calls.append(("addSkip", (test, reason)))
+
+    def addExpectedFailure(self, test, err):
+        self.calls.append(("addExpectedFailure", (test, err)))
+
+    def addUnexpectedSuccess(self, test):
+        self.calls.append(("addUnexpectedSuccess", (test,)))
+        self._stop_on_failure()
+
+    def addSubTest(self, test, subtest, err):
+        self.calls.append(("addSubTest", (test, subtest, err)))
+        if err is not None:
+            self._stop_on_failure()
+
+    def addDuration(self, test, elapsed):
+        self.calls.append(("addDuration", (test, elapsed)))
+
+    def _stop_on_failure(self):
+        # Same as the failfast decorator of the methods of TestResult
+        if self.failfast:
+            self.stop()
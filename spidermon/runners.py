@@ -1,10 +1,13 @@
 import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, ClassVar
 
 from spidermon.core.suites import MonitorSuite
 from spidermon.data import Data
 from spidermon.exceptions import InvalidMonitor, InvalidResult
 from spidermon.results.monitor import MonitorResult
+from spidermon.results.recorded import RecordedResult
 from spidermon.results.text import TextMonitorResult
 
 
@@ -12,43 +15,117 @@ class MonitorRunner:
     data_immutable_dicts: ClassVar[list[str]] = ["stats"]
     data_default_data: ClassVar[dict[str, Any]] = {"meta": {}}
 
-    def __init__(self):
+    def __init__(self, max_workers=None):
         self.suite = None
         self.result = None
         self.data = None
+        self.max_workers = max_workers
 
     def run(self, suite, **data):
+        self.prepare(suite, **data)
+        return self.run_suite()
+
+    def prepare(self, suite, **data):
+        """
+        Set up ``suite`` and the result to run it with ``data``, without
+        running it yet.
+        """
         if not isinstance(suite, MonitorSuite):
             raise InvalidMonitor("Runners must receive a MonitorSuite instance")
         self.suite = suite
         data = dict(self.data_default_data, **data)
         self.data = self.transform_data(**data)
+        self.suite.reset()
         self.suite.init_data(self.data)
         self.result = self.create_result()
         if not isinstance(self.result, MonitorResult):
             raise InvalidResult("Runners must use a MonitorResult instance")
-        return self.run_suite()
 
     def transform_data(self, **data):
         data = data or {}
         new_data_dict = {}
         for attr_name, attr in data.items():
-            new_data = Data(attr) if attr_name in self.data_immutable_dicts else attr
+            # Data is already immutable, so it is shared instead of copied
+            new_data = (
+                Data(attr)
+                if attr_name in self.data_immutable_dicts and not isinstance(attr, Data)
+                else attr
+            )
             new_data_dict[attr_name] = new_data
         return Data(new_data_dict)
 
     def run_suite(self):
+        self.run_suite_monitors()
+        return self.run_suite_actions()
+
+    def run_suite_monitors(self):
         self.result.start()
         self.run_monitors()
+
+    def run_suite_actions(self):
         self.run_actions()
         self.result.finish()
         return self.result
 
     def run_monitors(self):
         self.result.next_step()
-        self.suite(self.result)
+        if self.max_workers and self.max_workers > 1:
+            self.run_monitors_concurrently()
+        else:
+            self.suite(self.result)
         self.result.finish_step()
 
+    def run_monitors_concurrently(self):
+        """
+        Run the monitors of the suite in up to ``max_workers`` threads.
+
+        All the monitors of each class run together in a test suite, with
+        their class fixtures. Module fixtures are run once, from this thread,
+        around all the monitors. Monitor classes start in the order of their
+        first monitor, and their results are added to the result of the
+        runner from this thread, in that same order.
+        """
+        classes_monitors = {}
+        for monitor in self.suite.all_monitors:
+            classes_monitors.setdefault(type(monitor), []).append(monitor)
+        modules = [
+            sys.modules[module_name]
+            for module_name in dict.fromkeys(
+                monitor_class.__module__ for monitor_class in classes_monitors
+            )
+        ]
+        groups = [
+            _MonitorClassSuite(monitors) for monitors in classes_monitors.values()
+        ]
+
+        set_up_modules = []
+        try:
+            for module in modules:
+                set_up_module = getattr(module, "setUpModule", None)
+                if set_up_module is not None:
+                    set_up_module()
+                set_up_modules.append(module)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for recorded_result in pool.map(self._run_monitors, groups):
+                    # Results of the monitors after a stop are dropped, as if
+                    # they had not run
+                    if self.result.shouldStop:
+                        break
+                    recorded_result.replay(self.result)
+        finally:
+            for module in reversed(set_up_modules):
+                tear_down_module = getattr(module, "tearDownModule", None)
+                if tear_down_module is not None:
+                    tear_down_module()
+            unittest.case.doModuleCleanups()
+
+    def _run_monitors(self, monitors):
+        recorded_result = RecordedResult()
+        recorded_result.failfast = self.result.failfast
+        if not self.result.shouldStop:
+            monitors(recorded_result)
+        return recorded_result
+
     def run_actions(self):
         # Run monitors finished actions
         self.result.next_step()
@@ -97,10 +174,23 @@ class MonitorRunner:
 
 
 class TextMonitorRunner(MonitorRunner):
-    def __init__(self, stream=sys.stderr, verbosity=1):
-        super().__init__()
+    def __init__(self, stream=sys.stderr, verbosity=1, max_workers=None):
+        super().__init__(max_workers=max_workers)
         self.stream = stream
         self.verbosity = verbosity
 
     def create_result(self):
         return TextMonitorResult(stream=self.stream, verbosity=self.verbosity)
+
+
+class _MonitorClassSuite(unittest.TestSuite):
+    """
+    Suite of the monitors of a class run concurrently with the monitors of
+    other classes, whose module fixtures are run by the runner instead.
+    """
+
+    def _handleModuleFixture(self, test, result):
+        pass
+
+    def _handleModuleTearDown(self, result):
+        pass
@@ -1,48 +1,189 @@
 import re
+from collections import Counter
+
+try:
+    from itemadapter import ItemAdapter
+except ImportError:
+    # Only needed to count the fields of items that are not dicts
+    ItemAdapter = None  # type: ignore[misc,assignment]
+
+ITEM_SCRAPED_COUNT_STAT = "spidermon_item_scraped_count"
+ITEM_SCRAPED_COUNT_PREFIX = f"{ITEM_SCRAPED_COUNT_STAT}/"
+FIELD_COVERAGE_STAT = "spidermon_field_coverage"
+FIELD_COVERAGE_PREFIX = f"{FIELD_COVERAGE_STAT}/"
+ITEM_TYPE_RE = re.compile(r"\w+")
 
 
 def calculate_field_coverage(stats):
+    """
+    Return the ``spidermon_field_coverage`` stats computed from the
+    ``spidermon_item_scraped_count`` stats, in a single pass over ``stats``.
+
+    The coverage of a field is its count divided by the count of its item
+    type. Fields of the items of a list field also get their coverage
+    relative to the number of items in that list, under their
+    ``/_items/`` path.
+    """
     coverage = {}
+    # Count and coverage stats prefix of each item type, None for invalid ones
+    item_types = {}
     for key, value in stats.items():
-        if not key.startswith("spidermon_item_scraped_count"):
+        if not key.startswith(ITEM_SCRAPED_COUNT_PREFIX):
             continue
 
-        item_type_m = re.search(
-            r"spidermon_item_scraped_count\/(?P<item_type>\w+)\/(?P<item_key>.*)",
-            key,
+        item_type, sep, item_key = key[len(ITEM_SCRAPED_COUNT_PREFIX) :].partition("/")
+        if not sep or item_key.endswith("/_items"):
+            continue
+        if item_type not in item_types:
+            item_types[item_type] = (
+                (
+                    stats.get(ITEM_SCRAPED_COUNT_PREFIX + item_type),
+                    f"{FIELD_COVERAGE_PREFIX}{item_type}/",
+                )
+                if ITEM_TYPE_RE.fullmatch(item_type)
+                else None
+            )
+        if item_types[item_type] is None:
+            continue
+        item_type_total, coverage_prefix = item_types[item_type]
+
+        # Fields of list items are also relative to the last list of their path
+        list_end = item_key.rfind("/_items/")
+        if list_end == -1:
+            coverage[coverage_prefix + item_key] = value / item_type_total
+            continue
+
+        root_field_type_total = stats.get(
+            f"{ITEM_SCRAPED_COUNT_PREFIX}{item_type}/{item_key[:list_end]}/_items",
         )
-        if item_type_m:
-            item_type = item_type_m.group(1)
-            item_key = item_type_m.group(2)
+        coverage[coverage_prefix + item_key.replace("/_items/", "/")] = (
+            value / item_type_total
+        )
+        coverage[coverage_prefix + item_key] = value / root_field_type_total
+
+    return coverage
 
-            item_type_total = stats.get(f"spidermon_item_scraped_count/{item_type}")
 
-            if "/_items" in item_key:
-                if item_key.endswith("/_items"):
-                    continue
+def get_field_coverage(stats):
+    """
+    Return the ``spidermon_field_coverage`` stats in ``stats``, completed
+    with those calculated by :func:`calculate_field_coverage`.
+    """
+    coverage = calculate_field_coverage(stats)
+    coverage.update(
+        (key, value)
+        for key, value in stats.items()
+        if key.startswith(FIELD_COVERAGE_PREFIX)
+    )
+    return coverage
 
-                levels = item_key.split("/_items/")
 
-                root_field_type_total = stats.get(
-                    f"spidermon_item_scraped_count/{item_type}/{'/_items/'.join(levels[:-1])}/_items",
-                )
+class FieldCoverageCounter:
+    """
+    Count the scraped items and their fields, per item type, as the
+    ``spidermon_item_scraped_count/<item_type>/<field_path>`` stats used by
+    :func:`calculate_field_coverage`.
 
-                item_field_coverage = value / root_field_type_total
-                global_field_coverage = value / item_type_total
+    Stat names are built once per item type and field path. When
+    ``buffered`` is enabled, counts are kept in memory until
+    :meth:`flush` adds them to the stats.
+    """
 
-                coverage[f"spidermon_field_coverage/{item_type}/{'/'.join(levels)}"] = (
-                    global_field_coverage
-                )
+    def __init__(
+        self,
+        stats,
+        skip_none_values=False,
+        list_nesting_levels=0,
+        dict_nesting_levels=-1,
+        buffered=False,
+    ):
+        self.stats = stats
+        self.skip_none_values = skip_none_values
+        self.list_nesting_levels = list_nesting_levels
+        self.dict_nesting_levels = dict_nesting_levels
+        self.buffered = buffered
+        self.counts = Counter()
+        self._item_type_names = {}
+        self._field_names = {}
+        # Bound once, as it is called for every field of every item
+        self._inc_value = self._inc_buffered_value if buffered else stats.inc_value
 
-                coverage[
-                    f"spidermon_field_coverage/{item_type}/{'/_items/'.join(levels)}"
-                ] = item_field_coverage
+    def count(self, item):
+        self._inc_value(ITEM_SCRAPED_COUNT_STAT)
+        item_type = type(item)
+        item_type_name = self._item_type_names.get(item_type)
+        if item_type_name is None:
+            item_type_name = f"{ITEM_SCRAPED_COUNT_STAT}/{item_type.__name__}"
+            self._item_type_names[item_type] = item_type_name
+        self._inc_value(item_type_name)
+        self._count_fields(
+            item,
+            item_type_name,
+            self.list_nesting_levels,
+            self.dict_nesting_levels,
+        )
 
-            else:
-                field_coverage = value / item_type_total
+    def flush(self):
+        """Add the counts kept in memory to the stats."""
+        counts, self.counts = self.counts, Counter()
+        for name, count in counts.items():
+            self.stats.inc_value(name, count)
 
-                coverage[f"spidermon_field_coverage/{item_type}/{item_key}"] = (
-                    field_coverage
-                )
+    def _inc_buffered_value(self, name, count=1):
+        self.counts[name] += count
 
-    return coverage
+    def _get_field_name(self, parent_name, field_name):
+        key = (parent_name, field_name)
+        name = self._field_names.get(key)
+        if name is None:
+            name = f"{parent_name}/{field_name}"
+            self._field_names[key] = name
+        return name
+
+    def _count_fields(
+        self,
+        item,
+        item_name,
+        list_nesting_levels,
+        dict_nesting_levels,
+        nesting_level=0,
+    ):
+        fields = item.items() if type(item) is dict else ItemAdapter(item).items()
+        for field_name, value in fields:
+            if self.skip_none_values and value is None:
+                continue
+
+            name = self._get_field_name(item_name, field_name)
+            self._inc_value(name)
+
+            if isinstance(value, dict):
+                # if there's no max (set to -1), we just proceed indefinitely (all levels)
+                # this is for backwards compatibility, without counting lists
+                if dict_nesting_levels == -1:
+                    self._count_fields(value, name, 0, -1)
+                elif nesting_level < dict_nesting_levels:
+                    self._count_fields(
+                        value,
+                        name,
+                        list_nesting_levels,
+                        dict_nesting_levels,
+                        nesting_level + 1,
+                    )
+                continue
+
+            if (
+                isinstance(value, list)
+                and value
+                and nesting_level < list_nesting_levels
+            ):
+                items_name = self._get_field_name(name, "_items")
+                self._inc_value(items_name, len(value))
+                for list_item in value:
+                    if isinstance(list_item, dict):
+                        self._count_fields(
+                            list_item,
+                            items_name,
+                            list_nesting_levels,
+                            dict_nesting_levels,
+                            nesting_level + 1,
+                        )
@@ -5,6 +5,11 @@ import pytest
 pytest.importorskip("scrapy")
 
 from spidermon.contrib.monitors.mixins import ValidationMonitorMixin
+from spidermon.contrib.monitors.mixins import validation as validation_module
+from spidermon.contrib.monitors.mixins.validation import (
+    FieldErrorsMatrix,
+    ValidationInfo,
+)
 from spidermon.contrib.scrapy.monitors import BaseScrapyMonitor
 from spidermon.data import Data
 
@@ -264,3 +269,213 @@ def test_check_field_errors_percent(monitor):
     msg = "50.0% of field field2 have validation errors!"
     with pytest.raises(AssertionError, match=msg):
         monitor.check_field_errors_percent(field_name="field2")
+
+
+def test_validation_info_extrapolates_sampled_items():
+    sampled_stats = {
+        **stats,
+        "spidermon/validation/items/total": 40,
+        "spidermon/validation/items/errors": 3,
+        "spidermon/validation/items/dropped": 3,
+    }
+    validation = ValidationInfo(sampled_stats)
+
+    assert validation.sample_rate == 0.25
+    assert validation.items.count == 40
+    assert validation.items.sampled == 10
+    assert validation.items.errors.count == 12
+    assert validation.items.errors.percent == 0.3
+    assert validation.items.dropped.count == 3
+    assert validation.fields.count == 400
+    field3_missing = validation.fields["field3"].errors["missing_required_field"]
+    assert field3_missing.count == 40
+    assert field3_missing.percent == 1
+    assert validation.errors["missing_required_field"].count == 60
+
+
+def test_validation_info_without_sampled_items():
+    validation = ValidationInfo({"spidermon/validation/items/total": 40})
+
+    assert validation.sample_rate == 1
+    assert validation.items.count == 40
+    assert validation.items.sampled == 0
+    assert validation.items.errors.count == 0
+
+
+def test_check_missing_required_field_sampled(monitor):
+    monitor.data = Data(
+        {"stats": {**stats, "spidermon/validation/items/total": 20}},
+    )
+    msg = "Required field field2 is missing in 10 items! (maximum allowed 7)"
+    with pytest.raises(AssertionError, match=re.escape(msg)):
+        monitor.check_missing_required_field("field2", allowed_count=7)
+    monitor.check_missing_required_field_percent("field2", allowed_percent=0.5)
+
+
+class ItemsCountingDict(dict):
+    items_calls = 0
+
+    def items(self):
+        self.items_calls += 1
+        return super().items()
+
+
+def test_validation_info_reads_stats_once():
+    validation_stats = ItemsCountingDict(
+        {
+            **stats,
+            "spidermon/validation/fields/errors/invalid_string": 3,
+            "spidermon/validation/fields/errors/invalid_string/field1": 2,
+            "spidermon/validation/fields/errors/invalid_string/field2": 1,
+            "spidermon/validation/fields/errors/invalid_string/field2/nested": 4,
+            "spidermon/validation/fields/errors/unlisted_error/field1": 7,
+            "spidermon/validation/items/errors": 5,
+            "spidermon/validation/items/dropped": 2,
+            "spidermon/other/items": 100,
+            "item_scraped_count": 10,
+        }
+    )
+    validation = ValidationInfo(validation_stats)
+    assert validation_stats.items_calls == 1
+
+    assert validation.items.count == 10
+    assert validation.items.errors.count == 5
+    assert validation.items.dropped.count == 2
+    assert validation.fields.count == 100
+    assert list(validation.errors) == ["missing_required_field", "invalid_string"]
+    assert validation.errors["missing_required_field"].count == 15
+    assert validation.errors["invalid_string"].count == 3
+    assert validation.errors["unlisted_error"].count == 0
+    assert sorted(validation.fields) == ["field1", "field2", "field3"]
+    assert validation.fields["field2"].errors.count == 6
+    assert validation.fields["field2"].errors["invalid_string"].count == 1
+
+
+def test_check_fields_errors_percent_many_fields(monitor):
+    many_fields_stats = {"spidermon/validation/items": 1000}
+    errors = ["missing_required_field", "invalid_string", "field_too_long"]
+    for error in errors:
+        many_fields_stats[f"spidermon/validation/fields/errors/{error}"] = 500
+        for i in range(500):
+            many_fields_stats[f"spidermon/validation/fields/errors/{error}/f{i}"] = 1
+    monitor.data = Data({"stats": many_fields_stats})
+
+    monitor.check_fields_errors_percent(allowed_percent=0.003)
+    assert monitor.validation.errors.count == 1500
+    assert monitor.validation.fields["f0"].errors.count == 3
+    with pytest.raises(AssertionError, match=re.escape("0.3% of field f499 have")):
+        monitor.check_fields_errors_percent(allowed_percent=0.002)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def matrix_backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(validation_module, "np", None)
+    return request.param
+
+
+def test_field_errors_matrix(matrix_backend):
+    matrix = FieldErrorsMatrix(
+        {
+            "missing_required_field": [("field2", 5), ("field3", 10)],
+            "invalid_string": [("field1", 2), ("field2", 1)],
+            "no_fields_error": [],
+        },
+    )
+    assert list(matrix.errors) == ["missing_required_field", "invalid_string"]
+    assert list(matrix.fields) == ["field2", "field3", "field1"]
+    assert matrix.total == 18
+    assert matrix.field_count("field2") == 6
+    assert matrix.field_count("unknown") == 0
+    assert matrix.error_count("invalid_string") == 3
+    assert matrix.field_errors("field2") == {
+        "missing_required_field": 5,
+        "invalid_string": 1,
+    }
+    assert matrix.error_fields("invalid_string") == {"field1": 2, "field2": 1}
+    assert matrix.fields_counts() == {"field2": 6, "field3": 10, "field1": 2}
+    assert matrix.fields_counts(["invalid_string", "unknown"]) == {
+        "field2": 1,
+        "field3": 0,
+        "field1": 2,
+    }
+    assert matrix.fields_percents(10) == {"field2": 0.6, "field3": 1, "field1": 0.2}
+    assert matrix.fields_percents(10, ["missing_required_field"]) == {
+        "field2": 0.5,
+        "field3": 1,
+        "field1": 0,
+    }
+    assert matrix.fields_percents(0) == {"field2": 0, "field3": 0, "field1": 0}
+
+
+def test_errors_and_fields_share_matrix(matrix_backend):
+    validation = ValidationInfo(stats)
+    assert validation.errors.matrix is validation.fields.matrix
+    assert validation.errors["missing_required_field"].fields["field3"].count == 10
+    assert validation.fields["field3"].errors["missing_required_field"].percent == 1
+    assert validation.errors["unknown"].count == 0
+    assert validation.fields["unknown"].errors.count == 0
+    assert str(validation.errors) == (
+        "(count=15, percent=1.50, {'missing_required_field': (count=15, "
+        "percent=1.50, fields=(count=15, percent=1.50, {'field2': (count=5, "
+        "percent=0.50), 'field3': (count=10, percent=1.00)}))})"
+    )
+
+
+def test_check_fields_errors_percent_backends(monitor, matrix_backend):
+    monitor.check_fields_errors_percent(allowed_percent=1)
+    msg = """
+There are field errors:
+50.0% of field field2 have validation errors!
+100.0% of field field3 have validation errors!
+    """.strip()
+    with pytest.raises(AssertionError, match=re.escape(msg)):
+        monitor.check_fields_errors_percent(errors=["missing_required_field"])
+
+
+def test_validation_is_shared_by_monitors_reading_the_same_stats():
+    shared_stats = Data(stats)
+    monitors = [DummyValidationMonitor() for _ in range(3)]
+    for m in monitors:
+        m.data = Data({"stats": shared_stats})
+
+    assert monitors[0].validation is monitors[1].validation
+    assert monitors[0].validation is monitors[2].validation
+
+    monitors[0].data = Data({"stats": Data(stats)})
+    assert monitors[0].validation is not monitors[1].validation
+
+
+def test_validation_is_rebuilt_when_plain_stats_change(monitor):
+    validation = monitor.validation
+    assert monitor.validation is validation
+
+    monitor.data = Data({"stats": dict(stats, **{"spidermon/validation/items": 20})})
+    assert monitor.validation is not validation
+    assert monitor.validation.items.count == 20
+
+
+def test_meta_dict_percent_counter_is_deprecated():
+    class ErrorsCounter(validation_module.MetaDictPercentCounter):
+        __items_class__ = validation_module.ErrorsDictPercentCounter
+
+    with pytest.warns(DeprecationWarning, match="MetaDictPercentCounter"):
+        counter = ErrorsCounter(10)
+    counter.add_values("error", "field", 2)
+    assert counter["error"].fields["field"].count == 2
+
+
+def test_errors_and_fields_add_values():
+    validation = ValidationInfo(stats)
+    validation.errors.add_values(key="missing_required_field", subkey="field2", value=1)
+    validation.errors.add_values(key="new_error", subkey="field4", value=3)
+    validation.fields.add_values(key="field2", subkey="new_error", value=2)
+
+    assert validation.errors["missing_required_field"].fields["field2"].count == 6
+    assert validation.errors["new_error"].fields["field4"].count == 3
+    assert validation.errors.count == 19
+    assert validation.fields["field2"].errors["new_error"].count == 2
+    assert validation.fields["field2"].errors["missing_required_field"].count == 5
+    assert "field4" not in list(validation.fields)
@@ -0,0 +1,76 @@
+import gzip
+import json
+import threading
+
+import pytest
+
+from spidermon.contrib.scrapy.invalid_items import InvalidItemsWriter
+
+
+def read_lines(path):
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_write_invalid_items(tmp_path):
+    writer = InvalidItemsWriter(
+        str(tmp_path / "%(name)s" / "invalid.jsonl.gz"),
+        spider_name="example",
+    )
+    writer.write({"foo": "bar"}, {"foo": ["Invalid"]})
+    writer.write({"price": 1.5}, {"name": ["Missing required field"]})
+    writer.close()
+
+    assert writer.written == 2
+    assert read_lines(tmp_path / "example" / "invalid.jsonl.gz") == [
+        {"item": {"foo": "bar"}, "errors": {"foo": ["Invalid"]}},
+        {"item": {"price": 1.5}, "errors": {"name": ["Missing required field"]}},
+    ]
+
+
+def test_invalid_items_are_not_changed_after_write(tmp_path):
+    writer = InvalidItemsWriter(str(tmp_path / "invalid.jsonl"))
+    item = {"foo": "bar"}
+    writer.write(item, {"foo": ["Invalid"]})
+    item["foo"] = "changed"
+    writer.close()
+    assert read_lines(tmp_path / "invalid.jsonl")[0]["item"] == {"foo": "bar"}
+
+
+def test_rotate_files(tmp_path):
+    writer = InvalidItemsWriter(
+        str(tmp_path / "invalid-%(part)d.jsonl"),
+        max_file_size=100,
+    )
+    for i in range(5):
+        writer.write({"foo": "x" * 50, "i": i}, {"foo": ["Invalid"]})
+    writer.close()
+
+    files = sorted(tmp_path.iterdir())
+    assert [f.name for f in files] == [f"invalid-{i}.jsonl" for i in range(5)]
+    assert [read_lines(f)[0]["item"]["i"] for f in files] == list(range(5))
+
+
+def test_rotate_files_requires_part(tmp_path):
+    with pytest.raises(ValueError, match=r"must contain %\(part\)d"):
+        InvalidItemsWriter(str(tmp_path / "invalid.jsonl"), max_file_size=100)
+
+
+def test_discard_items_when_queue_is_full(tmp_path, mocker, caplog):
+    writer = InvalidItemsWriter(str(tmp_path / "invalid.jsonl"), queue_size=1)
+    release = threading.Event()
+    write_record = writer._write_record
+    mocker.patch.object(
+        writer,
+        "_write_record",
+        side_effect=lambda record: release.wait() and write_record(record),
+    )
+    for i in range(10):
+        writer.write({"i": i}, {})
+    release.set()
+    writer.close()
+
+    assert writer.written + writer.discarded == 10
+    assert writer.discarded >= 8
+    assert "some of them will not be written" in caplog.text
@@ -146,3 +146,25 @@ def test_monitor_skip_if_no_items_set_false(field_coverage_monitor_suite):
     monitor_runner.run(field_coverage_monitor_suite, **data)
 
     assert not monitor_runner.result.wasSuccessful()
+
+
+def test_monitor_uses_coverage_calculated_from_field_counts(
+    field_coverage_monitor_suite,
+):
+    settings = {
+        "SPIDERMON_ADD_FIELD_COVERAGE": True,
+        "SPIDERMON_FIELD_COVERAGE_RULES": {
+            "dict/field1": 0.8,
+            "dict/field2": 0.4,
+        },
+    }
+    stats = {
+        "spidermon_item_scraped_count/dict": 10,
+        "spidermon_item_scraped_count/dict/field1": 9,
+        "spidermon_item_scraped_count/dict/field2": 5,
+    }
+    data = make_data_for_monitor(settings=settings, stats=stats)
+    monitor_runner = data.pop("runner")
+    monitor_runner.run(field_coverage_monitor_suite, **data)
+
+    assert monitor_runner.result.wasSuccessful()
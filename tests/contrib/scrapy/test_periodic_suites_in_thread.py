@@ -0,0 +1,119 @@
+import logging
+import threading
+from typing import ClassVar
+
+import pytest
+
+pytest.importorskip("scrapy")
+pytest.importorskip("pytest_twisted")
+
+import pytest_twisted
+from scrapy.spiders import Spider
+from scrapy.utils.test import get_crawler
+
+from spidermon import Monitor, MonitorSuite
+from spidermon.contrib.scrapy import runners
+from spidermon.contrib.scrapy.extensions import Spidermon
+from spidermon.contrib.scrapy.runners import SpiderMonitorResult
+from spidermon.core.actions import Action
+
+
+class RecordingMonitor(Monitor):
+    runs: ClassVar[list] = []
+
+    def test_record(self):
+        self.runs.append(
+            (threading.current_thread(), self.data.stats.get("item_scraped_count")),
+        )
+        self.data.crawler.stats.inc_value("item_scraped_count")
+
+
+class RecordingAction(Action):
+    runs: ClassVar[list] = []
+
+    def run_action(self):
+        self.runs.append(threading.current_thread())
+
+
+class RecordingSuite(MonitorSuite):
+    monitors: ClassVar[list] = [RecordingMonitor]
+    monitors_finished_actions: ClassVar[list] = [RecordingAction]
+
+
+class FailingSuite(MonitorSuite):
+    def on_monitors_finished(self, result):
+        raise ValueError("Failed")
+
+
+@pytest.fixture
+def spidermon():
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_PERIODIC_MONITORS_IN_THREAD": True,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    crawler.spider = Spider.from_crawler(crawler, "example.com")
+    return Spidermon(crawler)
+
+
+@pytest_twisted.ensureDeferred
+async def test_periodic_suites_run_in_thread_on_stats_snapshot(spidermon, caplog):
+    caplog.set_level(logging.INFO)
+    RecordingMonitor.runs = []
+    RecordingAction.runs = []
+    crawler = spidermon.crawler
+    crawler.stats.set_value("item_scraped_count", 1)
+    suite = RecordingSuite(crawler=crawler)
+
+    await spidermon._run_periodic_suites(crawler.spider, [suite])
+    await spidermon._run_periodic_suites(crawler.spider, [suite])
+
+    assert [count for _, count in RecordingMonitor.runs] == [1, 2]
+    assert all(
+        thread is not threading.main_thread() for thread, _ in RecordingMonitor.runs
+    )
+    assert crawler.stats.get_value("item_scraped_count") == 3
+    # Actions run in the reactor thread, after the monitors
+    assert RecordingAction.runs == [threading.main_thread()] * 2
+    assert "[Spidermon] RecordingMonitor/test_record... OK" in caplog.text
+    assert "[Spidermon] RecordingAction... OK" in caplog.text
+
+
+@pytest_twisted.ensureDeferred
+async def test_periodic_suites_errors_are_logged(spidermon, caplog):
+    crawler = spidermon.crawler
+    suite = FailingSuite(crawler=crawler)
+
+    result = await spidermon._run_periodic_suites(crawler.spider, [suite])
+
+    assert result is None
+    assert "Error running periodic monitor suites" in caplog.text
+    assert "ValueError: Failed" in caplog.text
+
+
+def test_periodic_suites_run_in_reactor_thread_by_default():
+    crawler = get_crawler(settings_dict={"SPIDERMON_ENABLED": True})
+    crawler.spider = Spider.from_crawler(crawler, "example.com")
+    spidermon = Spidermon(crawler)
+    RecordingMonitor.runs = []
+    RecordingAction.runs = []
+
+    result = spidermon._run_periodic_suites(
+        crawler.spider,
+        [RecordingSuite(crawler=crawler)],
+    )
+
+    assert result is None
+    assert RecordingMonitor.runs == [(threading.main_thread(), None)]
+
+
+def test_results_log_directly_when_the_reactor_never_ran(monkeypatch, caplog):
+    caplog.set_level(logging.INFO)
+    # The reactor sets its thread as the IO thread only once it runs
+    monkeypatch.setattr(runners, "isInIOThread", lambda: False)
+    crawler = get_crawler()
+    spider = Spider.from_crawler(crawler, "example.com")
+
+    SpiderMonitorResult(spider).log_info("Logged")
+
+    assert "[Spidermon] Logged" in caplog.text
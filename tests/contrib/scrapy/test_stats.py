@@ -0,0 +1,75 @@
+import pytest
+
+pytest.importorskip("scrapy")
+
+from scrapy.statscollectors import MemoryStatsCollector
+from scrapy.utils.test import get_crawler
+
+from spidermon.contrib.scrapy.stats import ValidationStatsManager
+
+
+@pytest.fixture
+def stats():
+    return MemoryStatsCollector(get_crawler())
+
+
+def test_add_field_error(stats):
+    manager = ValidationStatsManager(stats)
+    manager.add_field_error("Field Name", "Missing Required Field")
+    manager.add_field_error("Field Name", "Missing Required Field")
+    assert stats.get_stats() == {
+        "spidermon/validation/fields/errors": 2,
+        "spidermon/validation/fields/errors/missing_required_field": 2,
+        "spidermon/validation/fields/errors/missing_required_field/Field Name": 2,
+    }
+
+
+def test_stats_names_are_cached(stats, mocker):
+    slugify = mocker.patch(
+        "spidermon.contrib.scrapy.stats.slugify",
+        side_effect=lambda text, separator: text,
+    )
+    manager = ValidationStatsManager(stats)
+    for _ in range(3):
+        manager.add_item()
+        manager.add_field_error("field", "error")
+    assert slugify.call_count == 6
+
+
+def test_stats_names_cache_is_bounded(stats):
+    manager = ValidationStatsManager(stats)
+    manager.names_cache_size = 2
+    for i in range(5):
+        manager.add_field_error(f"field{i}", f"error{i}")
+    assert len(manager._names_cache) == 2
+    assert len(manager._field_errors_names_cache) == 2
+    assert stats.get_value("spidermon/validation/fields/errors/error4/field4") == 1
+
+
+def test_stats_names_without_slugify(stats):
+    manager = ValidationStatsManager(stats, prefix="custom", slugify=False)
+    manager.add_field_error("field", "Some Error")
+    assert stats.get_value("custom/fields/errors/Some Error/field") == 1
+
+
+def test_buffered_stats(stats):
+    manager = ValidationStatsManager(stats, buffered=True)
+    manager.add_item()
+    manager.add_item(count=2)
+    manager.add_fields(5)
+    manager.add_field_error("field", "error")
+    assert stats.get_stats() == {}
+
+    manager.flush()
+    assert stats.get_stats() == {
+        "spidermon/validation/items": 3,
+        "spidermon/validation/fields": 5,
+        "spidermon/validation/fields/errors": 1,
+        "spidermon/validation/fields/errors/error": 1,
+        "spidermon/validation/fields/errors/error/field": 1,
+    }
+
+    manager.add_item()
+    manager.flush()
+    manager.flush()
+    assert stats.get_value("spidermon/validation/items") == 4
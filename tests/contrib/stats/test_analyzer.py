@@ -0,0 +1,134 @@
+import re
+
+import pytest
+
+from spidermon.contrib.stats.analyzer import StatsAnalyzer, _get_literal_prefix
+from spidermon.data import Data
+
+stats = {
+    "downloader/response_count": 20,
+    "downloader/response_status_count/200": 15,
+    "downloader/response_status_count/404": 3,
+    "downloader/response_status_count/301": 2,
+    "downloader/response_bytes": 1000,
+    "spidermon/validation/items": 10,
+    "spidermon/validation/items/errors": 2,
+    "spidermon/validation/fields/errors/missing_required_field/url": 2,
+    "item_scraped_count": 10,
+}
+
+
+def search_all_keys(pattern, include_matches=False):
+    results = {}
+    for key, count in stats.items():
+        match = re.match(pattern, key)
+        if match:
+            results[key] = (
+                (count, match.group(1) if match.groups() else "")
+                if include_matches
+                else count
+            )
+    return results
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "downloader/response_count$",
+        r"downloader/response_status_count/(2\d{2})$",
+        "downloader/response_status_count/([^/]+)$",
+        "downloader/response_(count|bytes)$",
+        "downloader/response_status_count/200|item_scraped_count",
+        "downloaders?/response_count$",
+        "(?:spidermon|downloader)/.*count",
+        r"spidermon/validation/items(/errors)?$",
+        "items$",
+        "missing$",
+        ".*",
+    ],
+)
+def test_search(pattern):
+    analyzer = StatsAnalyzer(stats)
+    assert analyzer.search(pattern) == search_all_keys(pattern)
+    assert analyzer.search(pattern, include_matches=True) == search_all_keys(
+        pattern,
+        include_matches=True,
+    )
+
+
+def test_search_keeps_stats_order():
+    analyzer = StatsAnalyzer(stats)
+    results = analyzer.search("downloader/response_status_count/([^/]+)$")
+    assert list(results) == [
+        "downloader/response_status_count/200",
+        "downloader/response_status_count/404",
+        "downloader/response_status_count/301",
+    ]
+
+
+def test_search_with_prefix():
+    analyzer = StatsAnalyzer(stats, prefix="spidermon/validation")
+    assert analyzer.search("items$") == {"spidermon/validation/items": 10}
+
+
+def test_search_after_stats_change():
+    live_stats = dict(stats)
+    analyzer = StatsAnalyzer(live_stats)
+    assert analyzer.search("downloader/response_status_count/5") == {}
+    live_stats["downloader/response_status_count/500"] = 1
+    assert analyzer.search("downloader/response_status_count/5") == {
+        "downloader/response_status_count/500": 1,
+    }
+
+
+def test_search_after_stats_replaced():
+    live_stats = dict(stats)
+    analyzer = StatsAnalyzer(live_stats)
+    assert analyzer.search("downloader/response_status_count/5") == {}
+    # Same number of stats, different keys
+    del live_stats["downloader/response_count"]
+    live_stats["downloader/response_status_count/500"] = 1
+    assert analyzer.search("downloader/response_status_count/5") == {
+        "downloader/response_status_count/500": 1,
+    }
+    assert analyzer.search("downloader/response_count") == {}
+
+
+def test_search_in_data_only_indexes_once():
+    iterations = []
+
+    class IterationsData(Data):
+        def __iter__(self):
+            iterations.append(1)
+            return super().__iter__()
+
+    analyzer = StatsAnalyzer(IterationsData(stats))
+    for _ in range(3):
+        assert analyzer.search("downloader/response_status_count/4") == {
+            "downloader/response_status_count/404": 3,
+        }
+    assert len(iterations) == 1
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("downloader/response_count$", "downloader/response_count"),
+        ("downloader/(\\d+)", "downloader/"),
+        ("downloaders?/", "downloader"),
+        ("downloaders*/", "downloader"),
+        ("downloaders{0,1}/", "downloader"),
+        ("downloader.count", "downloader"),
+        (r"downloader\.count", "downloader"),
+        ("a|b", ""),
+        ("ab(c|d)", "ab"),
+        ("ab(c)|d", ""),
+        ("ab[|]c", "ab"),
+        ("ab[]|]c", "ab"),
+        (r"ab\|c", "ab"),
+        ("(?i)ab", ""),
+        ("", ""),
+    ],
+)
+def test_get_literal_prefix(pattern, expected):
+    assert _get_literal_prefix(pattern) == expected
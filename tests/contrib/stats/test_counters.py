@@ -0,0 +1,58 @@
+import pytest
+
+from spidermon.contrib.stats.counters import (
+    AttributeDictPercentCounter,
+    DictPercentCounter,
+    PercentCounter,
+)
+
+
+class ErrorsCounter(AttributeDictPercentCounter):
+    __slots__ = ()
+    __attribute_dict_name__ = "errors"
+
+
+def test_percent_counter():
+    counter = PercentCounter(count=1, total=4)
+    counter.inc_value(1)
+    assert counter.count == 2
+    assert counter.percent == 0.5
+    assert PercentCounter(count=1, total=0).percent == 0
+
+
+def test_dict_percent_counter():
+    counter = DictPercentCounter(total=10)
+    counter.add_value("a", 2)
+    counter.add_value("b", 3)
+    counter.add_value("a", 1)
+    assert counter.count == 6
+    assert counter.percent == 0.6
+    assert counter["a"].count == 3
+    assert counter["missing"].count == 0
+    assert list(counter) == ["a", "b"]
+    with pytest.raises(TypeError):
+        counter["c"] = PercentCounter()
+
+
+def test_attribute_dict_percent_counter():
+    counter = ErrorsCounter(total=10)
+    counter.add_value("missing_required_field", 2)
+    counter.add_value("invalid_string", 3)
+    assert counter.count == 5
+    assert counter.percent == 0.5
+    assert counter.errors is counter.attribute_dict
+    assert counter.errors["invalid_string"].count == 3
+    with pytest.raises(AttributeError, match="has no attribute 'fields'"):
+        counter.fields  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    "counter",
+    [
+        PercentCounter(),
+        DictPercentCounter(total=1),
+        ErrorsCounter(total=1),
+    ],
+)
+def test_counters_have_no_instance_dict(counter):
+    assert not hasattr(counter, "__dict__")
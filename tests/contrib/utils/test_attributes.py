@@ -7,8 +7,10 @@ pytest.importorskip("itemadapter")
 from itemadapter import ItemAdapter
 
 from spidermon.contrib.utils.attributes import (
+    NestedAttribute,
     get_nested_attribute,
     set_nested_attribute,
+    traverse_nested,
 )
 
 
@@ -56,3 +58,51 @@ def test_set_nested_attribute():
         match="NestedField does not support field: missing_attribute",
     ):
         set_nested_attribute(item, "attr1.missing_attribute", "foo")
+
+
+def test_traverse_nested_does_not_change_keys():
+    keys = ["attr1", "attr2"]
+    item = ItemAdapter({"attr1": {"attr2": {"attr3": "foobar"}}})
+    assert traverse_nested(item, keys)["attr3"] == "foobar"
+    assert keys == ["attr1", "attr2"]
+
+
+@pytest.mark.parametrize("wrap", [ItemAdapter, lambda item: item])
+def test_nested_attribute(wrap):
+    item = {"foo": None, "attr1": {"attr2": {"attr3": None}}}
+    attribute = NestedAttribute("attr1.attr2.attr3")
+
+    assert attribute.get(wrap(item)) is None
+    attribute.set(wrap(item), "bar")
+    assert attribute.get(wrap(item)) == "bar"
+    assert item["attr1"]["attr2"]["attr3"] == "bar"
+
+    foo = NestedAttribute("foo")
+    foo.set(wrap(item), "foobar")
+    assert item["foo"] == "foobar"
+
+    with pytest.raises(KeyError):
+        NestedAttribute("attr1.missing_attribute.attr2").get(wrap(item))
+    with pytest.raises(KeyError):
+        NestedAttribute("foo.missing_attribute").set(wrap(item), "bar")
+
+
+def test_nested_attribute_in_dataclasses():
+    @dataclass
+    class NestedField:
+        foo: str
+
+    @dataclass
+    class DummyItem:
+        attr1: NestedField
+
+    item = DummyItem(attr1=NestedField(foo="bar"))
+    attribute = NestedAttribute("attr1.foo")
+    assert attribute.get(item) == "bar"
+    attribute.set(ItemAdapter(item), "foobar")
+    assert item.attr1.foo == "foobar"
+    with pytest.raises(
+        KeyError,
+        match="NestedField does not support field: missing_attribute",
+    ):
+        NestedAttribute("attr1.missing_attribute").set(item, "foo")
@@ -0,0 +1,67 @@
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+import pytest
+
+pytest.importorskip("itemadapter")
+
+from itemadapter import ItemAdapter
+
+from spidermon.contrib.utils.items import ItemView
+
+
+@dataclass
+class Variant:
+    sku: str
+    price: float | None = None
+
+
+@dataclass
+class Product:
+    name: str
+    variants: list = field(default_factory=list)
+    details: dict = field(default_factory=dict)
+
+
+def test_item_view_matches_asdict():
+    item = Product(
+        name="foo",
+        variants=[Variant(sku="a", price=1.0), Variant(sku="b")],
+        details={"brand": "bar", "tags": ["x", "y"], "origin": Variant(sku="c")},
+    )
+    view = ItemView(item)
+
+    assert view == ItemAdapter(item).asdict()
+    assert list(view) == ["name", "variants", "details"]
+    assert len(view) == 3
+    assert "name" in view
+    assert "missing" not in view
+    assert isinstance(view["variants"][0], ItemView)
+    assert view["variants"][0]["sku"] == "a"
+    assert isinstance(view["details"]["origin"], ItemView)
+    assert repr(view) == repr(ItemAdapter(item).asdict())
+
+
+def test_item_view_does_not_copy_values():
+    tags = ["x", "y"]
+    item = {"name": "foo", "tags": tags}
+    view = ItemView(item)
+
+    assert view["tags"] is tags
+    item["name"] = "bar"
+    assert view["name"] == "bar"
+
+
+class Point(NamedTuple):
+    x: Any
+    y: Any
+
+
+def test_item_view_of_named_tuples():
+    item = {"point": Point(x={"value": 1}, y=2)}
+    view = ItemView(item)
+
+    assert isinstance(view["point"], Point)
+    assert isinstance(view["point"].x, ItemView)
+    assert view["point"].x["value"] == 1
+    assert view["point"].y == 2
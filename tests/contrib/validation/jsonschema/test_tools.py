@@ -1,8 +1,21 @@
+import json
+import os
+import pickle
+from urllib.error import HTTPError
+
 import pytest
 
 pytest.importorskip("scrapy")
 
 import spidermon.contrib.validation.jsonschema.tools as schema_tools
+from spidermon.contrib.validation import JSONSchemaValidator
+
+
+@pytest.fixture(autouse=True)
+def clear_schemas_cache():
+    schema_tools.clear_schemas_cache()
+    yield
+    schema_tools.clear_schemas_cache()
 
 
 def test_get_schema_from_url_fails(caplog, mocker):
@@ -54,3 +67,113 @@ def test_get_contents_fails(mocker, caplog):
             "'ValueError' object has no attribute 'decode'\nFailed to get 'https://example.com/schema.json'",
         ),
     ]
+
+
+def test_get_schema_from_url_is_cached(mocker):
+    get_contents = mocker.patch(
+        "spidermon.contrib.validation.jsonschema.tools.get_contents",
+        return_value='{"type": "object"}',
+    )
+    url = "https://example.com/schema.json"
+    schema = schema_tools.get_schema_from(url)
+    schema["type"] = "array"
+    assert schema_tools.get_schema_from(url) == {"type": "object"}
+    get_contents.assert_called_once_with(url)
+
+
+def test_get_schema_from_file_is_cached_until_modified(tmp_path, mocker):
+    path = tmp_path / "schema.json"
+    path.write_text('{"type": "object"}')
+    load = mocker.spy(json, "load")
+
+    assert schema_tools.get_schema_from(str(path)) == {"type": "object"}
+    assert schema_tools.get_schema_from(str(path)) == {"type": "object"}
+    assert load.call_count == 1
+
+    path.write_text('{"type": "array"}')
+    mtime = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+    assert schema_tools.get_schema_from(str(path)) == {"type": "array"}
+    assert load.call_count == 2
+
+
+def test_fetch_schemas(mocker):
+    get_contents = mocker.patch(
+        "spidermon.contrib.validation.jsonschema.tools.get_contents",
+        side_effect=lambda url: json.dumps({"title": url}),
+    )
+    urls = [f"https://example.com/schema{i}.json" for i in range(3)]
+    schema_tools.fetch_schemas([*urls, {"type": "object"}, "tests/schema.json"])
+    assert sorted(call.args[0] for call in get_contents.call_args_list) == urls
+
+    for url in urls:
+        assert schema_tools.get_schema_from(url) == {"title": url}
+    assert get_contents.call_count == 3
+
+
+def test_get_cached_contents(tmp_path, mocker):
+    url = "https://example.com/schema.json"
+    response = mocker.MagicMock()
+    response.__enter__.return_value = response
+    response.read.return_value = b'{"type": "object"}'
+    response.headers = {"ETag": '"v1"'}
+    urlopen = mocker.patch(
+        "spidermon.contrib.validation.jsonschema.tools.urlopen",
+        return_value=response,
+    )
+    assert schema_tools.get_cached_contents(url, tmp_path) == '{"type": "object"}'
+    assert not urlopen.call_args.args[0].has_header("If-none-match")
+
+    urlopen.side_effect = HTTPError(url, 304, "Not Modified", {}, None)
+    assert schema_tools.get_cached_contents(url, tmp_path) == '{"type": "object"}'
+    assert urlopen.call_args.args[0].get_header("If-none-match") == '"v1"'
+
+    urlopen.side_effect = OSError("Network is unreachable")
+    assert schema_tools.get_cached_contents(url, tmp_path) == '{"type": "object"}'
+
+
+def test_schemas_registry_reuses_loaded_schemas(mocker):
+    get_contents = mocker.patch(
+        "spidermon.contrib.validation.jsonschema.tools.get_contents",
+        return_value='{"type": "string"}',
+    )
+    url = "https://example.com/name.json"
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {"name": {"$ref": url}},
+    }
+    schema_tools.get_schema_from(url)
+    validator = JSONSchemaValidator(schema, registry=schema_tools.schemas_registry)
+
+    assert validator.validate({"name": "foo"}) == (True, {})
+    assert validator.validate({"name": 1}) == (False, {"name": ["Invalid string"]})
+    get_contents.assert_called_once_with(url)
+
+    validator = pickle.loads(pickle.dumps(validator))
+    assert validator.validate({"name": 1}) == (False, {"name": ["Invalid string"]})
+
+
+def test_referenced_schemas_are_retrieved_once(mocker):
+    contents = {
+        "https://example.com/name.json": '{"$ref": "string.json"}',
+        "https://example.com/string.json": '{"type": "string"}',
+    }
+    mocker.patch(
+        "spidermon.contrib.validation.jsonschema.tools.get_contents",
+        side_effect=contents.get,
+    )
+    get_schema_from = mocker.spy(schema_tools, "get_schema_from")
+    schema = {
+        "type": "object",
+        "properties": {"name": {"$ref": "https://example.com/name.json"}},
+    }
+    validator = JSONSchemaValidator(schema, registry=schema_tools.schemas_registry)
+
+    for _ in range(5):
+        assert validator.validate({"name": 1}) == (
+            False,
+            {"name": ["Invalid string"]},
+        )
+    assert validator.validate({"name": "foo"}) == (True, {})
+    assert get_schema_from.call_count == 2
@@ -1,3 +1,6 @@
+import asyncio
+import gzip
+import json
 from collections import defaultdict
 from dataclasses import dataclass
 
@@ -6,12 +9,15 @@ import pytest
 pytest.importorskip("scrapy")
 
 import scrapy
+from itemadapter import ItemAdapter
 from scrapy.utils.test import get_crawler
 
 from spidermon.contrib.scrapy.pipelines import (
     ItemValidationPipeline,
     PassThroughPipeline,
 )
+from spidermon.contrib.scrapy.signals import monitor_suites_starting
+from spidermon.contrib.validation import FastJSONSchemaValidator, JSONSchemaValidator
 
 
 @pytest.fixture
@@ -232,3 +238,427 @@ def test_ignore_classes_without_schema(dummy_schema):
 
     item = DummyItem()
     pipeline.process_item(item, None)
+
+
+def test_validation_engine_defaults_to_jsonschema(dummy_schema):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    [validator] = pipeline.validators[scrapy.Item]
+    assert type(validator) is JSONSchemaValidator
+
+
+def test_fastjsonschema_validation_engine(dummy_schema):
+    pytest.importorskip("fastjsonschema")
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_ADD_ERRORS_TO_ITEMS": True,
+        "SPIDERMON_VALIDATION_ENGINE": "fastjsonschema",
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    [validator] = pipeline.validators[scrapy.Item]
+    assert isinstance(validator, FastJSONSchemaValidator)
+
+    assert pipeline.process_item({"foo": "bar"}, None) == {"foo": "bar"}
+    result_item = pipeline.process_item({}, None)
+    assert result_item["_validation"] == {"foo": ["Missing required field"]}
+
+
+def test_validation_engine_from_object_path(dummy_schema):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_ENGINE": (
+            "spidermon.contrib.validation.JSONSchemaValidator"
+        ),
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    [validator] = pipeline.validators[scrapy.Item]
+    assert type(validator) is JSONSchemaValidator
+
+
+def test_invalid_validation_engine(dummy_schema):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_ENGINE": dict,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    with pytest.raises(
+        scrapy.exceptions.NotConfigured,
+        match=r"Invalid <.*> value for <SPIDERMON_VALIDATION_ENGINE> setting",
+    ):
+        ItemValidationPipeline.from_crawler(crawler)
+
+
+def test_batched_validation(dummy_schema):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_ADD_ERRORS_TO_ITEMS": True,
+        "SPIDERMON_VALIDATION_BATCH_SIZE": 3,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    stats = pipeline.stats.stats
+
+    async def process(items):
+        return await asyncio.gather(
+            *[pipeline.process_item(item, None) for item in items],
+        )
+
+    items = asyncio.run(process([{"foo": "bar"}, {}, {"foo": "bar"}]))
+    assert items[0] == {"foo": "bar"}
+    assert items[1] == {"_validation": {"foo": ["Missing required field"]}}
+    assert items[2] == {"foo": "bar"}
+    assert stats.get_value("spidermon/validation/items") == 3
+    assert stats.get_value("spidermon/validation/fields") == 2
+    assert stats.get_value("spidermon/validation/items/errors") == 1
+
+
+def test_batched_validation_drop_items(dummy_schema):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_DROP_ITEMS_WITH_ERRORS": True,
+        "SPIDERMON_VALIDATION_BATCH_SIZE": 2,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+
+    async def process(items):
+        return await asyncio.gather(
+            *[pipeline.process_item(item, None) for item in items],
+            return_exceptions=True,
+        )
+
+    valid, dropped = asyncio.run(process([{"foo": "bar"}, {"foo": "invalid"}]))
+    assert valid == {"foo": "bar"}
+    assert isinstance(dropped, scrapy.exceptions.DropItem)
+    stats = pipeline.stats.stats
+    assert stats.get_value("spidermon/validation/items/dropped") == 1
+
+
+def test_batched_validation_errors_fire_every_item(dummy_schema, mocker):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_BATCH_SIZE": 3,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    get_item_data = pipeline._get_item_data
+
+    def fail_for_broken_items(item, *args):
+        if "broken" in item:
+            raise ValueError("Broken item")
+        return get_item_data(item, *args)
+
+    mocker.patch.object(pipeline, "_get_item_data", fail_for_broken_items)
+
+    async def process(items):
+        # Items that never get a result would hang the test
+        return await asyncio.wait_for(
+            asyncio.gather(
+                *[pipeline.process_item(item, None) for item in items],
+                return_exceptions=True,
+            ),
+            timeout=5,
+        )
+
+    results = asyncio.run(process([{"foo": "bar"}, {"broken": 1}, {"foo": "bar"}]))
+    assert results[0] == {"foo": "bar"}
+    assert isinstance(results[1], ValueError)
+    assert results[2] == {"foo": "bar"}
+    assert pipeline.stats.stats.get_value("spidermon/validation/items") == 2
+
+    mocker.patch.object(pipeline.stats, "add_item", side_effect=ValueError("Stats"))
+    results = asyncio.run(process([{"foo": "bar"}] * 3))
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_batched_validation_flushes_on_close(dummy_schema):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_BATCH_SIZE": 10,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+
+    async def process():
+        pending = asyncio.ensure_future(pipeline.process_item({"foo": "bar"}, None))
+        await asyncio.sleep(0)
+        assert not pending.done()
+        pipeline.close_spider()
+        return await pending
+
+    assert asyncio.run(process()) == {"foo": "bar"}
+    assert pipeline.stats.stats.get_value("spidermon/validation/items") == 1
+
+
+def test_invalid_validation_pool(dummy_schema):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_POOL": "greenlet",
+    }
+    crawler = get_crawler(settings_dict=settings)
+    with pytest.raises(
+        scrapy.exceptions.NotConfigured,
+        match=r"Invalid <greenlet> value for <SPIDERMON_VALIDATION_POOL> setting",
+    ):
+        ItemValidationPipeline.from_crawler(crawler)
+
+
+def test_validation_does_not_copy_items(mocker):
+    @dataclass
+    class Variant:
+        sku: str
+
+    @dataclass
+    class Product:
+        name: str
+        variants: list
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "variants": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"sku": {"type": "string", "minLength": 2}},
+                    "required": ["sku"],
+                },
+            },
+        },
+        "required": ["name"],
+    }
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [schema],
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    asdict = mocker.spy(ItemAdapter, "asdict")
+
+    item = Product(name="foo", variants=[Variant(sku="ab"), Variant(sku="c")])
+    assert pipeline.process_item(item, None) is item
+    assert asdict.call_count == 0
+    stats = pipeline.stats.stats
+    assert stats.get_value("spidermon/validation/fields") == 2
+    assert (
+        stats.get_value(
+            "spidermon/validation/fields/errors/field_too_short/variants.1.sku"
+        )
+        == 1
+    )
+
+
+def test_find_validators_by_item_class():
+    class ParentItem(scrapy.Item):
+        foo = scrapy.Field()
+
+    class ChildItem(ParentItem):
+        pass
+
+    class OtherItem(scrapy.Item):
+        foo = scrapy.Field()
+
+    # Same class name as ParentItem, in a different "module"
+    ParentItemClone = type("ParentItem", (scrapy.Item,), {"foo": scrapy.Field()})
+
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": {
+            ParentItem: {"required": ["foo"]},
+            scrapy.Item: {"required": ["bar"]},
+        },
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    parent_validators = pipeline.validators[ParentItem]
+    item_validators = pipeline.validators[scrapy.Item]
+
+    assert pipeline.find_validators(ParentItem()) is parent_validators
+    assert pipeline.find_validators(ChildItem()) is parent_validators
+    assert pipeline.find_validators(OtherItem()) is item_validators
+    assert pipeline.find_validators(ParentItemClone()) is item_validators
+    assert pipeline.find_validators({}) is item_validators
+    assert set(pipeline._class_validators) == {
+        ParentItem,
+        ChildItem,
+        OtherItem,
+        ParentItemClone,
+        dict,
+    }
+
+
+def test_sampled_validation(dummy_schema, mocker):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_DROP_ITEMS_WITH_ERRORS": True,
+        "SPIDERMON_VALIDATION_SAMPLE_RATE": 0.5,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    stats = pipeline.stats.stats
+
+    mocker.patch("random.random", side_effect=[0.7, 0.2, 0.9])
+    items = [{"foo": "invalid"}, {"foo": "bar"}, {}]
+    assert [pipeline.process_item(item, None) for item in items] == items
+    assert stats.get_value("spidermon/validation/items") == 1
+    assert stats.get_value("spidermon/validation/items/total") == 3
+    assert stats.get_value("spidermon/validation/items/dropped") is None
+
+    mocker.patch("random.random", return_value=0.1)
+    with pytest.raises(scrapy.exceptions.DropItem):
+        pipeline.process_item({}, None)
+
+
+def test_sampled_validation_by_key(dummy_schema):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_SAMPLE_RATE": 0.3,
+        "SPIDERMON_VALIDATION_SAMPLE_KEY": "url",
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+
+    items = [{"url": f"https://example.com/{i}"} for i in range(1000)]
+    sampled = [item for item in items if pipeline._is_sampled(item)]
+    assert 200 < len(sampled) < 400
+    assert sampled == [item for item in items if pipeline._is_sampled(item)]
+
+
+@pytest.mark.parametrize("sample_rate", [0, -1, 1.5])
+def test_invalid_sample_rate(dummy_schema, sample_rate):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_SAMPLE_RATE": sample_rate,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    with pytest.raises(
+        scrapy.exceptions.NotConfigured,
+        match=r"value for <SPIDERMON_VALIDATION_SAMPLE_RATE> setting",
+    ):
+        ItemValidationPipeline.from_crawler(crawler)
+
+
+def test_buffered_validation_stats(dummy_schema):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_STATS_FLUSH_INTERVAL": 60,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    stats = crawler.stats
+
+    pipeline.process_item({"foo": "bar"}, None)
+    pipeline.process_item({}, None)
+    assert stats.get_value("spidermon/validation/items") is None
+
+    crawler.signals.send_catch_log(signal=monitor_suites_starting)
+    assert stats.get_value("spidermon/validation/items") == 2
+    assert stats.get_value("spidermon/validation/items/errors") == 1
+
+    pipeline.process_item({}, None)
+    pipeline.close_spider()
+    assert stats.get_value("spidermon/validation/items") == 3
+    assert stats.get_value("spidermon/validation/items/errors") == 2
+
+
+def test_write_invalid_items(dummy_schema, tmp_path):
+    path = tmp_path / "invalid.jsonl.gz"
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_ADD_ERRORS_TO_ITEMS": True,
+        "SPIDERMON_VALIDATION_INVALID_ITEMS_PATH": str(path),
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    pipeline.open_spider()
+    pipeline.process_item({"foo": "bar"}, None)
+    pipeline.process_item({"foo": "invalid"}, None)
+    pipeline.close_spider()
+
+    with gzip.open(path, "rt") as f:
+        assert [json.loads(line) for line in f] == [
+            {"item": {"foo": "invalid"}, "errors": {"foo": ["'bar' was expected"]}},
+        ]
+
+
+def test_write_invalid_items_once_with_all_errors(dummy_schema, tmp_path):
+    path = tmp_path / "invalid.jsonl"
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [
+            dummy_schema,
+            {"type": "object", "required": ["name"]},
+        ],
+        "SPIDERMON_VALIDATION_INVALID_ITEMS_PATH": str(path),
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    pipeline.open_spider()
+    pipeline.process_item({"foo": "invalid"}, None)
+    pipeline.close_spider()
+
+    with path.open() as f:
+        assert [json.loads(line) for line in f] == [
+            {
+                "item": {"foo": "invalid"},
+                "errors": {
+                    "foo": ["'bar' was expected"],
+                    "name": ["Missing required field"],
+                },
+            },
+        ]
+
+
+def test_written_invalid_items_are_not_changed_afterwards(dummy_schema, tmp_path):
+    path = tmp_path / "invalid.jsonl"
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_ADD_ERRORS_TO_ITEMS": True,
+        "SPIDERMON_VALIDATION_ERRORS_FIELD": "meta.errors",
+        "SPIDERMON_VALIDATION_INVALID_ITEMS_PATH": str(path),
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+    pipeline.open_spider()
+    item = pipeline.process_item({"foo": "invalid", "meta": {}, "tags": ["a"]}, None)
+    # Changed by a later pipeline
+    item["tags"].append("changed")
+    pipeline.close_spider()
+
+    assert item["meta"]["errors"]
+    with path.open() as f:
+        records = [json.loads(line) for line in f]
+    assert records[0]["item"] == {"foo": "invalid", "meta": {}, "tags": ["a"]}
+
+
+def test_invalid_items_rotation_requires_part(dummy_schema, tmp_path):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_INVALID_ITEMS_PATH": str(tmp_path / "invalid.jsonl"),
+        "SPIDERMON_VALIDATION_INVALID_ITEMS_MAX_SIZE": 1000,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    with pytest.raises(scrapy.exceptions.NotConfigured, match=r"%\(part\)d"):
+        ItemValidationPipeline.from_crawler(crawler)
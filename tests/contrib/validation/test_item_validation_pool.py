@@ -0,0 +1,82 @@
+import pytest
+
+pytest.importorskip("scrapy")
+pytest.importorskip("pytest_twisted")
+
+import pytest_twisted
+import scrapy
+from scrapy.utils.test import get_crawler
+from twisted.internet.defer import Deferred, gatherResults
+
+from spidermon.contrib.scrapy.pipelines import ItemValidationPipeline
+
+
+@pytest.fixture
+def dummy_schema():
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema",
+        "type": "object",
+        "properties": {
+            "foo": {"const": "bar"},
+        },
+        "required": ["foo"],
+        "additionalProperties": False,
+    }
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+@pytest_twisted.ensureDeferred
+async def test_validation_pool(dummy_schema, pool):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_ADD_ERRORS_TO_ITEMS": True,
+        "SPIDERMON_VALIDATION_POOL": pool,
+        "SPIDERMON_VALIDATION_POOL_SIZE": 2,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+
+    items = [
+        await pipeline.process_item({"foo": "bar"}, None),
+        await pipeline.process_item({}, None),
+    ]
+    pipeline.close_spider()
+
+    assert items == [
+        {"foo": "bar"},
+        {"_validation": {"foo": ["Missing required field"]}},
+    ]
+    stats = pipeline.stats.stats
+    assert stats.get_value("spidermon/validation/items") == 2
+    assert stats.get_value("spidermon/validation/items/errors") == 1
+
+
+@pytest.mark.parametrize("backpressure", ["wait", "inline"])
+@pytest_twisted.ensureDeferred
+async def test_validation_pool_backpressure(dummy_schema, backpressure):
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "SPIDERMON_VALIDATION_SCHEMAS": [dummy_schema],
+        "SPIDERMON_VALIDATION_DROP_ITEMS_WITH_ERRORS": True,
+        "SPIDERMON_VALIDATION_POOL": "thread",
+        "SPIDERMON_VALIDATION_POOL_QUEUE_SIZE": 1,
+        "SPIDERMON_VALIDATION_POOL_BACKPRESSURE": backpressure,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    pipeline = ItemValidationPipeline.from_crawler(crawler)
+
+    deferreds = [
+        Deferred.fromCoroutine(pipeline.process_item(item, None)).addErrback(
+            lambda f: f.value,
+        )
+        for item in [{"foo": "bar"}, {"foo": "bar"}, {"foo": "invalid"}]
+    ]
+    assert pipeline._pool_pending == 1
+    results = await gatherResults(deferreds)
+    pipeline.close_spider()
+
+    assert results[:2] == [{"foo": "bar"}, {"foo": "bar"}]
+    assert isinstance(results[2], scrapy.exceptions.DropItem)
+    assert pipeline._pool_pending == 0
+    assert pipeline.stats.stats.get_value("spidermon/validation/items/dropped") == 1
@@ -0,0 +1,25 @@
+from spidermon import Monitor
+
+calls = []
+
+
+def setUpModule():
+    calls.append("setUpModule")
+
+
+def tearDownModule():
+    calls.append("tearDownModule")
+
+
+class ModuleFixturesMonitor01(Monitor):
+    @classmethod
+    def setUpClass(cls):
+        calls.append("setUpClass")
+
+    def test_a(self):
+        calls.append("test_a")
+
+
+class ModuleFixturesMonitor02(Monitor):
+    def test_b(self):
+        calls.append("test_b")
@@ -2,6 +2,7 @@ import pytest
 
 from spidermon.data import Data
 from spidermon.exceptions import InvalidDataOperation
+from spidermon.runners import MonitorRunner
 
 
 @pytest.fixture
@@ -50,3 +51,31 @@ def test_update(data):
 def test_setdefault(data):
     with pytest.raises(InvalidDataOperation):
         data.setdefault("another_value", 0)
+
+
+def test_runner_copies_stats_into_data():
+    stats = {"item_scraped_count": 150}
+    data = MonitorRunner().transform_data(stats=stats)
+    assert isinstance(data.stats, Data)
+    assert data.stats == stats
+    assert data.stats is not stats
+
+
+def test_runner_shares_stats_data():
+    stats = Data(item_scraped_count=150)
+    data = MonitorRunner().transform_data(stats=stats)
+    assert data.stats is stats
+
+
+def test_get_view(data):
+    calls = []
+
+    def factory(d):
+        calls.append(d)
+        return d.item_scraped_count * 2
+
+    assert data.get_view("double", factory) == 300
+    assert data.get_view("double", factory) == 300
+    assert calls == [data]
+    assert data == {"item_scraped_count": 150}
+    assert Data(data).get_view("double", lambda _: None) is None
@@ -7,6 +7,8 @@ pytest.importorskip("scrapy")
 from scrapy import signals
 
 from spidermon.contrib.scrapy.extensions import Spidermon
+from spidermon.contrib.scrapy.signals import monitor_suites_starting
+from spidermon.data import Data
 
 
 @pytest.fixture
@@ -77,3 +79,55 @@ def test_engine_stopped_suites_should_run_from_signal(get_crawler, suites):
     spidermon.engine_stopped_suites[0].run = mock.MagicMock()
     crawler.signals.send_catch_log(signal=signals.engine_stopped, spider=crawler.spider)
     spidermon.engine_stopped_suites[0].run.assert_called_once_with(mock.ANY)
+
+
+def test_monitor_suites_starting_is_sent_before_suites_run(get_crawler, suites):
+    """Components get notified before the suites run, to update the stats"""
+    crawler = get_crawler()
+    spidermon = Spidermon(crawler, spider_opened_suites=suites)
+
+    def set_stats():
+        crawler.stats.set_value("buffered", True)
+
+    crawler.signals.connect(set_stats, signal=monitor_suites_starting)
+    stats_on_run = []
+    spidermon.spider_opened_suites[0].run = mock.MagicMock(
+        side_effect=lambda _: stats_on_run.append(crawler.stats.get_stats().copy()),
+    )
+    spidermon.spider_opened(crawler.spider)
+    assert stats_on_run == [{"buffered": True}]
+
+
+def test_periodic_suites_are_loaded_once(get_crawler, suites):
+    """Periodic suites are loaded when the spider opens and reused on each run"""
+    crawler = get_crawler()
+    spidermon = Spidermon(crawler, periodic_suites={suites[0]: 60})
+    with (
+        mock.patch.object(spidermon, "load_suite", wraps=spidermon.load_suite) as load,
+        mock.patch("spidermon.contrib.scrapy.extensions.LoopingCall") as looping_call,
+    ):
+        spidermon.spider_opened(crawler.spider)
+        run_periodic_suites, spider, periodic_suites = looping_call.call_args.args
+        run_periodic_suites(spider, periodic_suites)
+        run_periodic_suites(spider, periodic_suites)
+    load.assert_called_once_with(suites[0])
+    assert periodic_suites[0].__class__.__name__ == "Suite01"
+    assert periodic_suites[0].number_of_monitors == 3
+    looping_call.return_value.start.assert_called_once_with(60, now=False)
+
+
+def test_suites_share_a_stats_snapshot(get_crawler):
+    """Suites run by the same trigger share one read-only copy of the stats"""
+    crawler = get_crawler()
+    crawler.stats.set_value("item_scraped_count", 10)
+    suites = ["tests.fixtures.suites.Suite01", "tests.fixtures.suites.Suite02"]
+    spidermon = Spidermon(crawler, spider_opened_suites=suites)
+    with mock.patch(
+        "spidermon.contrib.scrapy.extensions.SpiderMonitorRunner.run",
+    ) as run:
+        spidermon.spider_opened(crawler.spider)
+    first_stats, second_stats = (call.kwargs["stats"] for call in run.call_args_list)
+    assert first_stats is second_stats
+    assert isinstance(first_stats, Data)
+    assert first_stats == {"item_scraped_count": 10}
+    assert first_stats is not crawler.stats.get_stats()
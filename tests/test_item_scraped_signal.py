@@ -769,3 +769,33 @@ async def test_item_scraped_count_list_of_dicts_two_nesting_levels(spider):
         )
         == 1
     )
+
+
+@deferred_f_from_coro_f
+async def test_item_scraped_count_buffered_until_flushed():
+    settings = {
+        "SPIDERMON_ENABLED": True,
+        "EXTENSIONS": {"spidermon.contrib.scrapy.extensions.Spidermon": 100},
+        "SPIDERMON_ADD_FIELD_COVERAGE": True,
+        "SPIDERMON_FIELD_COVERAGE_FLUSH_INTERVAL": 60,
+    }
+    crawler = get_crawler(settings_dict=settings)
+    spider = Spider.from_crawler(crawler, "example.com")
+
+    await send_item_scraped(spider, {"field1": "value1"})
+    await send_item_scraped(spider, {"field1": "value1", "field2": "value2"})
+
+    stats = spider.crawler.stats.get_stats()
+    assert stats.get("spidermon_item_scraped_count") is None
+
+    crawler.signals.send_catch_log(
+        signal=signals.spider_closed,
+        spider=spider,
+        reason=None,
+    )
+
+    stats = spider.crawler.stats.get_stats()
+    assert stats.get("spidermon_item_scraped_count") == 2
+    assert stats.get("spidermon_item_scraped_count/dict/field1") == 2
+    assert stats.get("spidermon_item_scraped_count/dict/field2") == 1
+    assert stats.get("spidermon_field_coverage/dict/field2") == 0.5
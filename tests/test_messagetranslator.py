@@ -27,3 +27,38 @@ def message_translator():
 )
 def test_message_translator(message_translator, original_message, translated_message):
     assert message_translator.translate_message(original_message) == translated_message
+
+
+def test_message_translator_caches_translations(message_translator):
+    message_translator.translate_message("email is a required property")
+    message_translator.translate_message("email is a required property")
+    cache_info = message_translator._translate_message.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+
+
+def test_message_translator_keeps_patterns_order():
+    class OrderMessageTranslator(MessageTranslator):
+        messages: ClassVar[dict[str, str]] = {
+            r"second": "First pattern",
+            r"^first": "Second pattern",
+        }
+
+    translator = OrderMessageTranslator()
+    assert translator._combined_pattern is not None
+    assert translator.translate_message("first second") == "First pattern"
+    assert translator.translate_message("first") == "Second pattern"
+    assert translator.translate_message("other") == "other"
+
+
+def test_message_translator_with_backreferences():
+    class BackreferenceMessageTranslator(MessageTranslator):
+        messages: ClassVar[dict[str, str]] = {
+            r"(?P<word>\w+) is \1": "Repeated {word}",
+            r"(?P<word>\w+) only": "Single {word}",
+        }
+
+    translator = BackreferenceMessageTranslator()
+    assert translator._combined_pattern is None
+    assert translator.translate_message("foo is foo") == "Repeated foo"
+    assert translator.translate_message("foo only") == "Single foo"
@@ -1,6 +1,13 @@
+import threading
+import unittest
+from typing import ClassVar
+
 import pytest
 
 from spidermon import Monitor, MonitorSuite
+from spidermon.contrib.monitors.mixins.spider import SpiderMonitorMixin
+from spidermon.core.actions import DummyAction
+from spidermon.data import Data
 from spidermon.exceptions import (
     InvalidMonitor,
     InvalidMonitorClass,
@@ -8,7 +15,9 @@ from spidermon.exceptions import (
     InvalidMonitorTuple,
     NotAllowedMethod,
 )
+from spidermon.runners import MonitorRunner
 
+from .fixtures import module_fixtures
 from .fixtures.cases import EmptyMonitor, Monitor01, Monitor02
 from .fixtures.suites import EmptySuite, Suite01, Suite02, Suite03, Suite04
 
@@ -163,3 +172,191 @@ def check_suite(suite, expected_number_of_monitors):
     assert len(all_monitors) == expected_number_of_monitors
     for test in all_monitors:
         assert isinstance(test, (Monitor, Monitor))
+
+
+class StatefulMonitor(Monitor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checked = []
+
+    def test_checked_once(self):
+        self.checked.append(self.data.stats["count"])
+        assert len(self.checked) == 1
+
+    def reset(self):
+        super().reset()
+        self.checked = []
+
+
+def test_suites_can_run_again():
+    suite = Suite02(
+        monitors=[StatefulMonitor],
+        monitors_finished_actions=[DummyAction],
+    )
+    monitors = suite.all_monitors
+    action = suite.monitors_finished_actions[0]
+
+    for count in range(1, 3):
+        result = MonitorRunner().run(suite, stats={"count": count})
+        assert len(result.monitor_results) == 6
+        assert result.all_monitors_passed
+        assert suite.all_monitors == monitors
+        assert monitors[-1].checked == [count]
+        assert action.data.stats["count"] == count
+
+
+class ResponsesMonitor(Monitor, SpiderMonitorMixin):
+    counts: ClassVar[list] = []
+
+    def test_responses(self):
+        self.counts.append(self.responses.count)
+
+
+def test_suites_run_again_with_changed_stats():
+    ResponsesMonitor.counts = []
+    suite = MonitorSuite(monitors=[ResponsesMonitor])
+    stats = {"downloader/response_count": 1}
+
+    for count in (1, 5):
+        stats["downloader/response_count"] = count
+        # Mutable stats are not copied into an immutable Data by the runner
+        suite.reset()
+        suite.init_data(Data({"stats": stats}))
+        suite.run(unittest.TestResult())
+
+    assert ResponsesMonitor.counts == [1, 5]
+
+
+def test_reset_clears_monitors_and_actions_state():
+    suite = Suite01(monitors_finished_actions=[DummyAction])
+    MonitorRunner().run(suite, stats={})
+    suite.reset()
+    assert all(monitor.data is None for monitor in suite.all_monitors)
+    assert suite.monitors_finished_actions[0].result is None
+    assert suite.monitors_finished_actions[0].data is None
+
+
+class ConcurrentMonitor(Monitor):
+    barrier = threading.Barrier(2, timeout=5)
+
+
+class WaitingForBMonitor(ConcurrentMonitor):
+    def test_a_waits_for_b(self):
+        self.barrier.wait()
+
+    def test_c_fails(self):
+        self.fail("Failed")
+
+
+class WaitingForAMonitor(ConcurrentMonitor):
+    def test_b_waits_for_a(self):
+        self.barrier.wait()
+
+
+def test_runner_runs_monitors_concurrently():
+    ConcurrentMonitor.barrier.reset()
+    suite = MonitorSuite(
+        monitors=[WaitingForBMonitor, WaitingForAMonitor, Monitor02],
+    )
+    result = MonitorRunner(max_workers=2).run(suite)
+
+    assert [r.item for r in result.monitor_results] == suite.all_monitors
+    assert [r.status for r in result.monitor_results] == [
+        "OK",
+        "FAIL",
+        "OK",
+        "OK",
+        "OK",
+    ]
+    assert result.monitor_results[1].reason == "Failed"
+    assert result.testsRun == 5
+
+
+def test_runner_runs_monitors_sequentially_by_default(monkeypatch):
+    monkeypatch.setattr(ConcurrentMonitor, "barrier", threading.Barrier(2, timeout=0.1))
+    suite = MonitorSuite(monitors=[WaitingForBMonitor, WaitingForAMonitor])
+    result = MonitorRunner().run(suite)
+
+    # The monitors waiting for each other time out
+    assert [r.status for r in result.monitor_results] == ["ERROR", "FAIL", "ERROR"]
+
+
+class ClassFixtureMonitor(Monitor):
+    calls: ClassVar[list] = []
+
+    @classmethod
+    def setUpClass(cls):
+        cls.calls.append("setUpClass")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.calls.append("tearDownClass")
+
+    def test_a(self):
+        self.calls.append("test_a")
+
+    def test_b(self):
+        self.calls.append("test_b")
+
+
+def test_concurrent_monitors_run_class_fixtures():
+    ClassFixtureMonitor.calls = []
+    suite = MonitorSuite(monitors=[ClassFixtureMonitor, Monitor02])
+    result = MonitorRunner(max_workers=2).run(suite)
+
+    assert ClassFixtureMonitor.calls == [
+        "setUpClass",
+        "test_a",
+        "test_b",
+        "tearDownClass",
+    ]
+    assert result.all_monitors_passed
+    assert result.testsRun == 4
+
+
+def test_concurrent_monitors_run_fixtures_once():
+    module_fixtures.calls.clear()
+
+    class InnerSuite(MonitorSuite):
+        monitors: ClassVar[list] = [module_fixtures.ModuleFixturesMonitor01]
+
+    suite = MonitorSuite(
+        monitors=[
+            module_fixtures.ModuleFixturesMonitor01,
+            module_fixtures.ModuleFixturesMonitor02,
+            InnerSuite,
+        ],
+    )
+    result = MonitorRunner(max_workers=2).run(suite)
+
+    calls = module_fixtures.calls
+    assert calls[0] == "setUpModule"
+    assert calls[-1] == "tearDownModule"
+    assert sorted(calls[1:-1]) == ["setUpClass", "test_a", "test_a", "test_b"]
+    assert calls.index("setUpClass") < calls.index("test_a")
+    assert [type(r.item) for r in result.monitor_results] == [
+        module_fixtures.ModuleFixturesMonitor01,
+        module_fixtures.ModuleFixturesMonitor01,
+        module_fixtures.ModuleFixturesMonitor02,
+    ]
+    assert result.all_monitors_passed
+
+
+class FailingMonitor(Monitor):
+    def test_a_fails(self):
+        self.fail("Failed")
+
+    def test_b_not_run(self):
+        pass
+
+
+def test_concurrent_monitors_stop_on_failfast():
+    suite = MonitorSuite(monitors=[FailingMonitor, Monitor02])
+    runner = MonitorRunner(max_workers=2)
+    runner.prepare(suite)
+    runner.result.failfast = True
+    runner.run_suite()
+
+    assert [r.status for r in runner.result.monitor_results] == ["FAIL"]
+    assert runner.result.testsRun == 1
+    assert runner.result.shouldStop
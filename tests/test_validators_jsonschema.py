@@ -1,19 +1,32 @@
 from __future__ import annotations
 
+import pickle
 from typing import Any, ClassVar
 from unittest import TestCase
 
+import pytest
+from jsonschema.exceptions import ValidationError
+from jsonschema.validators import validator_for as validator_for_original
 from slugify import slugify
 
-from spidermon.contrib.validation import JSONSchemaValidator, messages
+from spidermon.contrib.validation import (
+    FastJSONSchemaValidator,
+    JSONSchemaValidator,
+    messages,
+)
 from spidermon.contrib.validation.jsonschema.formats import is_email, is_url
+from spidermon.contrib.validation.jsonschema.translator import (
+    JSONSchemaMessageTranslator,
+)
 
 
 class SchemaTestCaseMetaclass(type):
     def __new__(mcs, name, bases, attrs):
-        def _test_function(data_test):
+        def _test_function(data_test, validator_cls=JSONSchemaValidator):
             def _function(self):
-                validator = JSONSchemaValidator(data_test.schema or self.schema)
+                if validator_cls is FastJSONSchemaValidator:
+                    pytest.importorskip("fastjsonschema")
+                validator = validator_cls(data_test.schema or self.schema)
                 assert validator.validate(data_test.data) == (
                     data_test.valid,
                     data_test.expected_errors,
@@ -25,6 +38,11 @@ class SchemaTestCaseMetaclass(type):
         for dt in getattr(cls, "data_tests", []):
             function_name = f"test_{slugify(dt.name, separator='_').lower()}"
             setattr(cls, function_name, _test_function(dt))
+            setattr(
+                cls,
+                f"{function_name}_fastjsonschema",
+                _test_function(dt, FastJSONSchemaValidator),
+            )
         return cls
 
 
@@ -1722,3 +1740,102 @@ class Unique(SchemaTest):
             expected_errors={"": [messages.NOT_UNIQUE]},
         ),
     ]
+
+
+def test_jsonschema_validator_is_built_once(mocker):
+    validator_for = mocker.patch(
+        "spidermon.contrib.validation.jsonschema.validator.validator_for",
+        wraps=validator_for_original,
+    )
+    validator = JSONSchemaValidator({"required": ["foo"]})
+    assert validator.validate({"foo": 1}) == (True, {})
+    assert validator.validate({}) == (False, {"foo": [messages.MISSING_REQUIRED_FIELD]})
+    assert validator.validate({"foo": 1}) == (True, {})
+    assert validator_for.call_count == 1
+
+
+def test_fastjsonschema_validator_skips_jsonschema_for_valid_data(mocker):
+    pytest.importorskip("fastjsonschema")
+    validator = FastJSONSchemaValidator(
+        {"$schema": "http://json-schema.org/draft-07/schema#", "required": ["foo"]},
+    )
+    validator._validator = mocker.Mock(wraps=validator._validator)
+    assert validator.validate({"foo": 1}) == (True, {})
+    assert validator._validator.iter_errors.call_count == 0
+    assert validator.validate({}) == (False, {"foo": [messages.MISSING_REQUIRED_FIELD]})
+    assert validator._validator.iter_errors.call_count == 1
+
+
+def test_fastjsonschema_validator_uses_jsonschema_for_other_drafts(caplog):
+    pytest.importorskip("fastjsonschema")
+    # Draft 2020-12 is the default draft of jsonschema
+    schema = {"prefixItems": [{"type": "string"}]}
+    validator = FastJSONSchemaValidator(schema)
+
+    assert validator._compiled is None
+    assert "falling back to jsonschema" in caplog.text
+    assert validator.validate([1]) == JSONSchemaValidator(schema).validate([1])
+    assert not validator.validate([1])[0]
+
+
+@pytest.mark.parametrize(
+    "validator_cls", [JSONSchemaValidator, FastJSONSchemaValidator]
+)
+def test_jsonschema_validator_is_picklable(validator_cls):
+    if validator_cls is FastJSONSchemaValidator:
+        pytest.importorskip("fastjsonschema")
+    validator = pickle.loads(pickle.dumps(validator_cls({"required": ["foo"]})))
+    assert validator.validate({"foo": 1}) == (True, {})
+    assert validator.validate({}) == (False, {"foo": [messages.MISSING_REQUIRED_FIELD]})
+
+
+def test_translate_error_uses_keyword_instead_of_message():
+    translator = JSONSchemaMessageTranslator()
+    error = ValidationError(
+        "a reworded message",
+        validator="type",
+        validator_value=["string", "null"],
+    )
+    assert translator.translate_error(error) == messages.NOT_NULL
+    error = ValidationError("'foo' is a required property", validator="unknown")
+    assert translator.translate_error(error) == messages.MISSING_REQUIRED_FIELD
+
+
+def test_custom_translator_messages_are_used():
+    class CustomTranslator(JSONSchemaMessageTranslator):
+        messages: ClassVar[dict[str, str]] = {
+            r"^.+ is a required property$": "Required!",
+        }
+
+    validator = JSONSchemaValidator(
+        {"required": ["foo", "bar"]},
+        translator=CustomTranslator(),
+    )
+    assert validator.validate({"bar": 1}) == (False, {"foo": ["Required!"]})
+
+
+def test_draft3_required_field_name():
+    validator = JSONSchemaValidator(
+        {
+            "$schema": "http://json-schema.org/draft-03/schema#",
+            "properties": {"foo": {"required": True}},
+        },
+    )
+    assert validator.validate({}) == (
+        False,
+        {"foo": [messages.MISSING_REQUIRED_FIELD]},
+    )
+
+
+def test_untranslated_required_field_names():
+    validator = JSONSchemaValidator(
+        {"required": ["foo", "bar", "baz"]},
+        use_default_translator=False,
+    )
+    assert validator.validate({"bar": 1}) == (
+        False,
+        {
+            "foo": ["'foo' is a required property"],
+            "baz": ["'baz' is a required property"],
+        },
+    )
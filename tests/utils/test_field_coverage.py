@@ -1,4 +1,30 @@
-from spidermon.utils.field_coverage import calculate_field_coverage
+import pytest
+
+from spidermon.utils.field_coverage import (
+    FieldCoverageCounter,
+    calculate_field_coverage,
+)
+
+
+class Stats:
+    """The part of the Scrapy stats collector used by the counter."""
+
+    def __init__(self):
+        self._stats = {}
+
+    def inc_value(self, key, count=1, start=0):
+        self._stats[key] = self._stats.setdefault(key, start) + count
+
+    def get_value(self, key, default=None):
+        return self._stats.get(key, default)
+
+    def get_stats(self):
+        return self._stats
+
+
+@pytest.fixture
+def stats():
+    return Stats()
 
 
 def test_calculate_field_coverage_from_stats():
@@ -83,3 +109,83 @@ def test_calculate_field_coverage_field_ends_with_items():
 
     coverage = calculate_field_coverage(spider_stats)
     assert coverage == expected_coverage
+
+
+def test_field_coverage_counter(stats):
+    counter = FieldCoverageCounter(stats, list_nesting_levels=1)
+    counter.count({"field1": {"field1.1": "value"}, "field2": [{"a": 1}, "b"]})
+    counter.count({"field1": None, "field2": []})
+
+    assert stats.get_stats() == {
+        "spidermon_item_scraped_count": 2,
+        "spidermon_item_scraped_count/dict": 2,
+        "spidermon_item_scraped_count/dict/field1": 2,
+        "spidermon_item_scraped_count/dict/field1/field1.1": 1,
+        "spidermon_item_scraped_count/dict/field2": 2,
+        "spidermon_item_scraped_count/dict/field2/_items": 2,
+        "spidermon_item_scraped_count/dict/field2/_items/a": 1,
+    }
+
+
+def test_field_coverage_counter_skip_none_values(stats):
+    counter = FieldCoverageCounter(stats, skip_none_values=True)
+    counter.count({"field1": None, "field2": "value"})
+
+    assert stats.get_value("spidermon_item_scraped_count/dict/field1") is None
+    assert stats.get_value("spidermon_item_scraped_count/dict/field2") == 1
+
+
+def test_field_coverage_counter_buffered(stats):
+    counter = FieldCoverageCounter(stats, buffered=True)
+    for _ in range(3):
+        counter.count({"field1": "value"})
+
+    assert stats.get_stats() == {}
+
+    counter.flush()
+    assert stats.get_stats() == {
+        "spidermon_item_scraped_count": 3,
+        "spidermon_item_scraped_count/dict": 3,
+        "spidermon_item_scraped_count/dict/field1": 3,
+    }
+
+    counter.count({"field1": "value"})
+    counter.flush()
+    assert stats.get_value("spidermon_item_scraped_count/dict/field1") == 4
+
+
+def test_calculate_field_coverage_from_counter_with_deep_nesting(stats):
+    counter = FieldCoverageCounter(stats, list_nesting_levels=3)
+    counter.count({"a": [{"b": [{"c": [{"d": 1}, {}]}, {"c": []}]}]})
+    counter.count({"a": [{"b": []}], "e": {"f": {"g": 1}}})
+
+    coverage = calculate_field_coverage(stats.get_stats())
+
+    assert coverage == {
+        "spidermon_field_coverage/dict/a": 1.0,
+        "spidermon_field_coverage/dict/a/b": 1.0,
+        "spidermon_field_coverage/dict/a/_items/b": 1.0,
+        "spidermon_field_coverage/dict/a/b/c": 1.0,
+        "spidermon_field_coverage/dict/a/_items/b/_items/c": 1.0,
+        "spidermon_field_coverage/dict/a/b/c/d": 0.5,
+        "spidermon_field_coverage/dict/a/_items/b/_items/c/_items/d": 0.5,
+        "spidermon_field_coverage/dict/e": 0.5,
+        "spidermon_field_coverage/dict/e/f": 0.5,
+        "spidermon_field_coverage/dict/e/f/g": 0.5,
+    }
+
+
+def test_calculate_field_coverage_field_names_starting_with_items():
+    spider_stats = {
+        "spidermon_item_scraped_count/dict": 4,
+        "spidermon_item_scraped_count/dict/field": 4,
+        "spidermon_item_scraped_count/dict/field/_items_count": 2,
+        "spidermon_item_scraped_count/not-a-type/field": 1,
+    }
+
+    coverage = calculate_field_coverage(spider_stats)
+
+    assert coverage == {
+        "spidermon_field_coverage/dict/field": 1.0,
+        "spidermon_field_coverage/dict/field/_items_count": 0.5,
+    }